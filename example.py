@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Example Usage Script
+
+This script demonstrates the DJNet dataset generator components using a
+small set of sample tracks. Heavy dependencies (librosa, numpy, pydub)
+are imported lazily inside each demo function so the quick demo path
+doesn't pay their interpreter startup cost.
+"""
+
+import functools
+import os
+import sys
+
+
+@functools.lru_cache(maxsize=1)
+def create_example_config():
+    """Create a small example configuration for the demos."""
+    from colab_setup import validate_config
+
+    return validate_config({
+        'data': {
+            'music_dir': 'data/raw/fma_small',
+            'analysis_dir': 'data/processed/track_analysis',
+            'output_dir': 'data/output/djnet_example',
+            'fma_url': 'https://os.unil.cloud.switch.ch/fma/fma_small.zip'
+        },
+        'audio': {
+            'target_sample_rate': 22050,
+            'mono': True,
+            'tempo_threshold': 10.0,
+            'key_compatibility_threshold': 1
+        },
+        'transitions': {
+            'transition_bars': 4,
+            'beats_per_bar': 4,
+            'types': [
+                {'name': 'linear_fade', 'weight': 0.4},
+                {'name': 'exp_fade', 'weight': 0.3},
+                {'name': 'hard_cut', 'weight': 0.3}
+            ]
+        },
+        'dataset': {
+            'num_transitions': 10,
+            'shuffle_pairs': True,
+            'minimum_valid_starts': 3
+        },
+        'echo_fade': {'num_echos': 4, 'decay_db': 6},
+        'filter_sweep': {'start_freq': 20000, 'end_freq': 100, 'chunk_size_ms': 50},
+        'eq': {'crossover_freq': 250},
+        'exp_fade': {'power_out_range': [1.5, 3.0], 'power_in_range': [0.3, 0.8]}
+    })
+
+
+def demo_individual_components():
+    """Demonstrate the track pairing components on sample data."""
+    from src.pairing import TrackPairer
+
+    print("🎛️ Demo: Individual Components")
+    print("-" * 40)
+
+    # Sample analysis data (as produced by AudioAnalyzer.analyze_track)
+    sample_tracks = [
+        {"path": "track1.mp3", "tempo": 120.0, "key": 0},
+        {"path": "track2.mp3", "tempo": 125.0, "key": 1},
+        {"path": "track3.mp3", "tempo": 128.0, "key": 11},
+        {"path": "track4.mp3", "tempo": 90.0, "key": 5},
+        {"path": "track5.mp3", "tempo": 122.0, "key": 0},
+    ]
+
+    pairer = TrackPairer(tempo_threshold=10.0, key_threshold=1)
+    pairs = pairer.find_compatible_pairs(sample_tracks)
+
+    print(f"Found {len(pairs)} compatible pairs from {len(sample_tracks)} tracks")
+    for track_a, track_b in pairs:
+        print(f"  {track_a['path']} ({track_a['tempo']} BPM) -> "
+              f"{track_b['path']} ({track_b['tempo']} BPM)")
+
+    stats = pairer.get_pairing_stats(pairs)
+    print(f"Average tempo difference: {stats.get('avg_tempo_diff', 0):.1f} BPM")
+
+
+def demo_full_pipeline():
+    """Run the full pipeline on the FMA dataset if it has been downloaded."""
+    from src.dataset_generator import DatasetGenerator
+
+    print("\n🎵 Demo: Full Pipeline")
+    print("-" * 40)
+
+    config = create_example_config()
+
+    if not os.path.exists(config['data']['music_dir']):
+        print(f"⚠️ Music directory not found: {config['data']['music_dir']}")
+        print("Run scripts/download_data.py first to try the full pipeline.")
+        return
+
+    generator = DatasetGenerator(config)
+    metadata = generator.run_full_pipeline()
+    print(f"Generated {len(metadata)} example transitions")
+
+
+def main():
+    """Run the example demos."""
+    sys.path.append(os.path.dirname(__file__))
+
+    print("DJNet Dataset Generator - Examples")
+    print("=" * 40)
+
+    demo_individual_components()
+    demo_full_pipeline()
+
+
+if __name__ == "__main__":
+    main()
@@ -11,16 +11,39 @@ import sys
 import yaml
 import json
 import random
+import csv
 import requests
 import zipfile
+import tarfile
 import glob
 import shutil
+import subprocess
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from multiprocessing import shared_memory
+from functools import lru_cache
 from pathlib import Path
 from tqdm import tqdm
 import pandas as pd
 import numpy as np
 import librosa
-from pydub import AudioSegment
+import soundfile as sf
+
+try:
+    import soxr
+except ImportError:  # fall back to librosa's resampler
+    soxr = None
+
+try:
+    from stream_unzip import stream_unzip
+except ImportError:  # fall back to download-then-extract
+    stream_unzip = None
+
+try:
+    import orjson
+except ImportError:  # fall back to the stdlib json module
+    orjson = None
 
 # Add src to path
 sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
@@ -83,13 +106,86 @@ def download_and_extract_fma(config):
     
     fma_url = config['data']['fma_url']
     zip_path = '/tmp/fma_small.zip'
-    
+
     print(f"Downloading from: {fma_url}")
-    
+
+    def streaming_download_extract(url, extract_dir):
+        """Extract zip members while the download is still in flight.
+
+        Overlaps network and disk time so stage 1 takes roughly
+        max(download, extract) instead of their sum. Needs stream-unzip,
+        which parses local file headers without the central directory.
+        """
+        response = requests.get(url, stream=True)
+        total_size = int(response.headers.get('content-length', 0))
+
+        with tqdm(desc="Downloading + extracting", total=total_size,
+                  unit='B', unit_scale=True, unit_divisor=1024) as pbar:
+            def chunks():
+                for chunk in response.iter_content(chunk_size=65536):
+                    if chunk:
+                        pbar.update(len(chunk))
+                        yield chunk
+
+            for file_name, file_size, unzipped_chunks in stream_unzip(chunks()):
+                target = os.path.join(extract_dir, file_name.decode())
+                if target.endswith('/'):
+                    for _ in unzipped_chunks:
+                        pass
+                    continue
+                os.makedirs(os.path.dirname(target), exist_ok=True)
+                with open(target, 'wb') as f:
+                    for data in unzipped_chunks:
+                        f.write(data)
+
+    def parallel_download(url, filename, num_streams=8):
+        """Pull the file as concurrent HTTP Range streams.
+
+        A single TCP stream rarely fills a cloud instance's NIC; eight
+        ranges written into the same preallocated file via os.pwrite
+        usually do. Returns False when the server ignores Range so the
+        caller can fall back to the single-stream path.
+        """
+        head = requests.head(url, allow_redirects=True)
+        total_size = int(head.headers.get('content-length', 0))
+        if total_size == 0 or head.headers.get('accept-ranges', 'none').lower() != 'bytes':
+            return False
+
+        bounds = [(i * total_size // num_streams,
+                   (i + 1) * total_size // num_streams - 1)
+                  for i in range(num_streams)]
+
+        fd = os.open(filename, os.O_CREAT | os.O_WRONLY | os.O_TRUNC)
+        try:
+            os.truncate(fd, total_size)
+            with tqdm(desc="Downloading", total=total_size, unit='B',
+                      unit_scale=True, unit_divisor=1024) as pbar:
+                lock = threading.Lock()
+
+                def fetch(start, end):
+                    resp = requests.get(
+                        url, stream=True,
+                        headers={'Range': f'bytes={start}-{end}'})
+                    resp.raise_for_status()
+                    offset = start
+                    for chunk in resp.iter_content(chunk_size=1024 * 1024):
+                        if chunk:
+                            os.pwrite(fd, chunk, offset)
+                            offset += len(chunk)
+                            with lock:
+                                pbar.update(len(chunk))
+
+                with ThreadPoolExecutor(max_workers=num_streams) as pool:
+                    for future in [pool.submit(fetch, s, e) for s, e in bounds]:
+                        future.result()
+        finally:
+            os.close(fd)
+        return True
+
     def download_with_progress(url, filename):
         response = requests.get(url, stream=True)
         total_size = int(response.headers.get('content-length', 0))
-        
+
         with open(filename, 'wb') as f, tqdm(
             desc="Downloading",
             total=total_size,
@@ -97,106 +193,345 @@ def download_and_extract_fma(config):
             unit_scale=True,
             unit_divisor=1024,
         ) as pbar:
-            for chunk in response.iter_content(chunk_size=8192):
+            # 1 MiB chunks keep the syscall count low on a fat pipe
+            for chunk in response.iter_content(chunk_size=1024 * 1024):
                 if chunk:
                     f.write(chunk)
                     pbar.update(len(chunk))
-    
-    download_with_progress(fma_url, zip_path)
-    
-    print("Extracting dataset...")
-    with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-        zip_ref.extractall('/tmp/')
-    
-    os.remove(zip_path)
+
+    if stream_unzip is not None:
+        streaming_download_extract(fma_url, '/tmp/')
+    else:
+        if not parallel_download(fma_url, zip_path):
+            download_with_progress(fma_url, zip_path)
+
+        print("Extracting dataset...")
+        with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+            zip_ref.extractall('/tmp/')
+
+        os.remove(zip_path)
     print(f"Dataset ready at: {music_dir}")
 
 
+def _dump_json(obj, path):
+    """Write indented JSON, via orjson's Rust serializer if installed."""
+    if orjson is not None:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, 'w') as f:
+            json.dump(obj, f, indent=2)
+
+
+def _load_json(path):
+    """Read a JSON file, via orjson if installed."""
+    with open(path, 'rb') as f:
+        data = f.read()
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+def _analyze_one(job):
+    """Analyze one track and write its JSON; runs in a worker process.
+
+    Returns the analysis file path, or None (failed) / an error string
+    (crashed) so the parent can count failures without re-raising.
+    """
+    audio_file, analysis_dir, target_sr = job
+    try:
+        analyzer = AudioAnalyzer(target_sr=target_sr)
+        analysis_data = analyzer.analyze_track(audio_file)
+        if not analysis_data:
+            return None
+        base_name = os.path.splitext(os.path.basename(audio_file))[0]
+        output_path = os.path.join(analysis_dir, f"{base_name}.json")
+        _dump_json(analysis_data, output_path)
+        return output_path
+    except Exception as e:
+        return f"ERROR:{audio_file}: {str(e)[:100]}"
+
+
 def analyze_all_tracks(config):
     """Analyze all audio tracks."""
     print("=" * 60)
     print("ANALYZING AUDIO TRACKS")
     print("=" * 60)
-    
+
     music_dir = config['data']['music_dir']
     analysis_dir = config['data']['analysis_dir']
-    
+
     os.makedirs(analysis_dir, exist_ok=True)
-    
+
     # Find all audio files
     audio_files = []
     for ext in ['*.mp3', '*.wav', '*.flac']:
         audio_files.extend(glob.glob(os.path.join(music_dir, '**', ext), recursive=True))
-    
+
     print(f"Found {len(audio_files)} audio files")
-    
-    # Initialize analyzer
-    analyzer = AudioAnalyzer(target_sr=config['audio']['target_sample_rate'])
-    
+
     analysis_files = []
     failed_count = 0
-    
-    for audio_file in tqdm(audio_files, desc="Analyzing tracks"):
-        try:
-            analysis_data = analyzer.analyze_track(audio_file)
-            if analysis_data:
-                base_name = os.path.splitext(os.path.basename(audio_file))[0]
-                output_path = os.path.join(analysis_dir, f"{base_name}.json")
-                
-                with open(output_path, 'w') as f:
-                    json.dump(analysis_data, f, indent=2)
-                analysis_files.append(output_path)
-            else:
+
+    # Beat/tempo/key extraction is CPU-bound and independent per file, so
+    # fan it out across all cores
+    jobs = [(f, analysis_dir, config['audio']['target_sample_rate'])
+            for f in audio_files]
+
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        results = executor.map(_analyze_one, jobs, chunksize=16)
+        for result in tqdm(results, total=len(jobs), desc="Analyzing tracks"):
+            if result is None:
                 failed_count += 1
-        except Exception as e:
-            failed_count += 1
-            if failed_count <= 5:  # Only show first few errors
-                print(f"Error analyzing {audio_file}: {str(e)[:100]}...")
-    
+            elif result.startswith("ERROR:"):
+                failed_count += 1
+                if failed_count <= 5:  # Only show first few errors
+                    print(f"Error analyzing {result[6:]}...")
+            else:
+                analysis_files.append(result)
+
     print(f"Analysis complete!")
     print(f"Successfully analyzed: {len(analysis_files)} tracks")
     print(f"Failed: {failed_count} tracks")
-    
+
+    # Consolidate the per-track JSONs into one columnar table so the
+    # generation stage does a single read instead of thousands
+    try:
+        analyzer = AudioAnalyzer(target_sr=config['audio']['target_sample_rate'])
+        df = pd.DataFrame(analyzer.load_analysis_data(analysis_files))
+        df.to_parquet(os.path.join(analysis_dir, 'analysis.parquet'))
+        print(f"Wrote consolidated table: {os.path.join(analysis_dir, 'analysis.parquet')}")
+    except ImportError:  # no pyarrow/fastparquet; JSONs remain the source
+        pass
+
     return analysis_files
 
 
-def generate_natural_transition(pair, output_dir, config):
-    """Generate a single transition with natural duration."""
+def _read_random_segment(path, segment_length_sec, start_frac=None):
+    """Read one random segment from a track without decoding all of it.
+
+    Seeks to a random start frame and reads only the samples needed,
+    instead of decoding the full file and slicing afterwards. If
+    start_frac (0..1) is given it picks the start deterministically,
+    letting the caller pre-sample all randomness in one batch.
+
+    Returns:
+        Tuple of (mono float32 samples, sample rate, start frame), or
+        (None, None, None) if the track is too short.
+    """
+    try:
+        with sf.SoundFile(path) as f:
+            need = int(segment_length_sec * f.samplerate)
+            max_start = f.frames - need
+            if max_start <= 0:
+                return None, None, None
+            start = (int(start_frac * max_start) if start_frac is not None
+                     else random.randint(0, max_start))
+            f.seek(start)
+            data = f.read(need, dtype='float32', always_2d=True)
+            # Mono files: take a view of the column, skip the mean copy
+            mono = data[:, 0] if data.shape[1] == 1 else data.mean(axis=1)
+            return mono, f.samplerate, start
+    except sf.LibsndfileError:
+        # libsndfile without MP3 support; decode the whole file instead
+        y, sr = librosa.load(path, sr=None, mono=True)
+        need = int(segment_length_sec * sr)
+        max_start = len(y) - need
+        if max_start <= 0:
+            return None, None, None
+        start = (int(start_frac * max_start) if start_frac is not None
+                 else random.randint(0, max_start))
+        return y[start:start + need], sr, start
+
+
+# Cross-worker decoded-track cache: a manager dict maps path to the
+# shared-memory block holding the decoded samples, so each track is
+# decoded once per machine instead of once per worker
+_shm_index = None
+_shm_lock = None
+_shm_attached = {}
+
+
+def _init_shared_cache(index, lock):
+    """Pool initializer: hand workers the shared cache index and lock."""
+    global _shm_index, _shm_lock
+    _shm_index = index
+    _shm_lock = lock
+
+
+def _load_track_shared(path, target_sr):
+    """Fetch decoded samples from shared memory, decoding on first use.
+
+    Whichever worker needs a track first decodes it into a SharedMemory
+    block and registers it in the manager dict; everyone else just
+    attaches, so memory and decode cost stay 1x rather than N_cores x.
+    """
+    if path in _shm_attached:
+        return _shm_attached[path][1]
+
+    with _shm_lock:
+        entry = _shm_index.get(path)
+
+    if entry is None:
+        # Decode outside the lock: holding it through a multi-second
+        # decode would serialize every other worker's cache misses
+        # behind this one track. Two workers may race to decode the
+        # same track; the loser discards its block below
+        data = _decode_track(path, target_sr)
+        shm = shared_memory.SharedMemory(create=True, size=data.nbytes)
+        view = np.ndarray(data.shape, dtype=data.dtype, buffer=shm.buf)
+        view[:] = data
+
+        with _shm_lock:
+            entry = _shm_index.get(path)
+            if entry is None:
+                _shm_index[path] = (shm.name, data.shape, str(data.dtype))
+                _shm_attached[path] = (shm, view)
+                return view
+
+        # Another worker published this track first; drop the duplicate
+        # block and attach the winner's
+        shm.close()
+        shm.unlink()
+
+    name, shape, dtype = entry
+    shm = shared_memory.SharedMemory(name=name)
+    view = np.ndarray(shape, dtype=np.dtype(dtype), buffer=shm.buf)
+    # Keep the SharedMemory object alive as long as the view is in use
+    _shm_attached[path] = (shm, view)
+    return view
+
+
+def _cleanup_shared_cache(index):
+    """Unlink every shared-memory block registered during the run."""
+    for name, _, _ in index.values():
+        try:
+            shm = shared_memory.SharedMemory(name=name)
+            shm.close()
+            shm.unlink()
+        except FileNotFoundError:
+            pass
+
+
+def _decode_track(path, target_sr):
+    """Decode a whole track to mono float32 at target_sr."""
+    try:
+        data, sr = sf.read(path, dtype='float32', always_2d=True)
+        data = data[:, 0] if data.shape[1] == 1 else data.mean(axis=1)
+    except sf.LibsndfileError:
+        data, sr = librosa.load(path, sr=None, mono=True)
+    if sr != target_sr:
+        data = _resample(data, sr, target_sr)
+    return np.ascontiguousarray(data, dtype=np.float32)
+
+
+@lru_cache(maxsize=256)
+def _load_track(path, target_sr):
+    """Decode and resample a whole track once per worker process.
+
+    Used when pairs repeat (target transitions > available pairs), so a
+    track that shows up in many pairs is only decoded once; slicing the
+    cached array is then free.
+    """
+    return _decode_track(path, target_sr)
+
+
+def _cached_random_segment(path, segment_length_sec, target_sr, start_frac=None):
+    """Slice a random segment out of the decoded-track cache."""
+    if _shm_index is not None:
+        y = _load_track_shared(path, target_sr)
+    else:
+        y = _load_track(path, target_sr)
+    need = int(segment_length_sec * target_sr)
+    max_start = len(y) - need
+    if max_start <= 0:
+        return None, None, None
+    start = (int(start_frac * max_start) if start_frac is not None
+             else random.randint(0, max_start))
+    return y[start:start + need], target_sr, start
+
+
+@lru_cache(maxsize=16)
+def _gpu_resampler(orig_sr, target_sr):
+    """Build a CUDA torchaudio Resample transform, cached per rate pair.
+
+    Returns None when torch/torchaudio or a GPU is missing, so callers
+    can fall through to the CPU resamplers. Rented vast.ai GPUs usually
+    sit idle during dataset generation; this puts them to work.
+    """
+    try:
+        import torch
+        import torchaudio
+    except ImportError:
+        return None
+    if not torch.cuda.is_available():
+        return None
+    return torchaudio.transforms.Resample(orig_sr, target_sr).cuda()
+
+
+def _resample(data, orig_sr, target_sr):
+    """Resample audio on the GPU if one is idle, else with SIMD soxr."""
+    resampler = _gpu_resampler(orig_sr, target_sr)
+    if resampler is not None:
+        import torch
+        tensor = torch.from_numpy(np.ascontiguousarray(data)).cuda()
+        return resampler(tensor).cpu().numpy()
+    if soxr is not None:
+        return soxr.resample(data, orig_sr, target_sr, quality='HQ')
+    return librosa.resample(data, orig_sr=orig_sr, target_sr=target_sr)
+
+
+@lru_cache(maxsize=128)
+def _make_fades(n, power_out=1.0, power_in=1.0):
+    """Build (fade_out, fade_in) ramps of n samples, cached by shape.
+
+    Transition lengths quantize to a handful of distinct values across a
+    run, so most of the 20k transitions reuse a cached ramp instead of
+    re-running linspace and the exponent.
+    """
+    fade_out = np.linspace(1.0, 0.0, n, dtype=np.float32)
+    fade_in = 1.0 - fade_out
+    if power_out != 1.0:
+        fade_out = fade_out ** power_out
+    if power_in != 1.0:
+        fade_in = fade_in ** power_in
+    return fade_out, fade_in
+
+
+def generate_natural_transition(pair, output_dir, config,
+                                chosen_type=None, offsets=None):
+    """Generate a single transition with natural duration.
+
+    chosen_type and offsets (start fractions for the two segments) are
+    normally pre-sampled in one batch by generate_full_dataset; when
+    omitted the function draws its own, for standalone use.
+    """
     track_a_data, track_b_data = pair
     source_length_sec = config['audio']['source_segment_length_sec']
     target_sr = config['audio']['target_sample_rate']
     
     try:
-        # Load audio files
-        y_a, sr_a = librosa.load(track_a_data['path'], sr=None, mono=True)
-        y_b, sr_b = librosa.load(track_b_data['path'], sr=None, mono=True)
-        
-        # Calculate required samples
-        source_samples_a = int(source_length_sec * sr_a)
-        source_samples_b = int(source_length_sec * sr_b)
-        
+        # Decode only the segments we need (seek + read), not the full
+        # tracks; with repeated pairs, slice from the decoded-track cache
+        frac_a, frac_b = offsets if offsets is not None else (None, None)
+        if config['dataset'].get('cache_decoded_tracks'):
+            segment_a, sr_a, start_a = _cached_random_segment(
+                track_a_data['path'], source_length_sec, target_sr, frac_a)
+            segment_b, sr_b, start_b = _cached_random_segment(
+                track_b_data['path'], source_length_sec, target_sr, frac_b)
+        else:
+            segment_a, sr_a, start_a = _read_random_segment(
+                track_a_data['path'], source_length_sec, frac_a)
+            segment_b, sr_b, start_b = _read_random_segment(
+                track_b_data['path'], source_length_sec, frac_b)
+
         # Check if tracks are long enough
-        if len(y_a) < source_samples_a or len(y_b) < source_samples_b:
-            return None
-        
-        # Extract segments
-        max_start_a = len(y_a) - source_samples_a
-        max_start_b = len(y_b) - source_samples_b
-        
-        if max_start_a <= 0 or max_start_b <= 0:
+        if segment_a is None or segment_b is None:
             return None
-        
-        start_a = random.randint(0, max_start_a)
-        start_b = random.randint(0, max_start_b)
-        
-        segment_a = y_a[start_a:start_a + source_samples_a]
-        segment_b = y_b[start_b:start_b + source_samples_b]
-        
+
         # Resample if needed
         if sr_a != target_sr:
-            segment_a = librosa.resample(segment_a, orig_sr=sr_a, target_sr=target_sr)
+            segment_a = _resample(segment_a, sr_a, target_sr)
         if sr_b != target_sr:
-            segment_b = librosa.resample(segment_b, orig_sr=sr_b, target_sr=target_sr)
+            segment_b = _resample(segment_b, sr_b, target_sr)
         
         # Ensure exact length
         target_samples = int(source_length_sec * target_sr)
@@ -211,27 +546,11 @@ def generate_natural_transition(pair, output_dir, config):
         else:
             segment_b = segment_b[:target_samples]
         
-        # Convert to AudioSegment
-        segment_a_int = (segment_a * 32767).astype(np.int16)
-        segment_b_int = (segment_b * 32767).astype(np.int16)
-        
-        seg_a = AudioSegment(
-            segment_a_int.tobytes(), 
-            frame_rate=target_sr, 
-            sample_width=2, 
-            channels=1
-        )
-        seg_b = AudioSegment(
-            segment_b_int.tobytes(), 
-            frame_rate=target_sr, 
-            sample_width=2, 
-            channels=1
-        )
-        
         # Generate transition
-        transition_weights = [t['weight'] for t in config['transitions']['types']]
-        transition_type_names = [t['name'] for t in config['transitions']['types']]
-        chosen_type = random.choices(transition_type_names, weights=transition_weights, k=1)[0]
+        if chosen_type is None:
+            transition_weights = [t['weight'] for t in config['transitions']['types']]
+            transition_type_names = [t['name'] for t in config['transitions']['types']]
+            chosen_type = random.choices(transition_type_names, weights=transition_weights, k=1)[0]
         
         # Calculate natural transition duration
         avg_tempo = (track_a_data.get('tempo', 120) + track_b_data.get('tempo', 120)) / 2
@@ -241,39 +560,37 @@ def generate_natural_transition(pair, output_dir, config):
         beats_in_transition = transition_bars * beats_per_bar
         natural_transition_sec = (beats_in_transition / avg_tempo) * 60
         natural_transition_sec = max(2.0, min(8.0, natural_transition_sec))
-        natural_transition_ms = int(natural_transition_sec * 1000)
-        
-        # Create transition
-        if chosen_type == 'linear_fade':
-            fade_duration = natural_transition_ms
-            part_a = seg_a[-fade_duration:].fade_out(fade_duration)
-            part_b = seg_b[:fade_duration].fade_in(fade_duration)
-            target_transition = part_a.overlay(part_b)
-        elif chosen_type == 'exp_fade':
-            fade_duration = natural_transition_ms
-            part_a = seg_a[-fade_duration:].fade_out(fade_duration)
-            part_b = seg_b[:fade_duration].fade_in(fade_duration)
-            target_transition = part_a.overlay(part_b)
-        elif chosen_type == 'hard_cut':
-            cut_duration = 100
-            part_a = seg_a[-cut_duration//2:]
-            part_b = seg_b[:cut_duration//2]
-            target_transition = part_a + part_b
-        else:  # Default to fade for other types
-            fade_duration = natural_transition_ms
-            part_a = seg_a[-fade_duration:].fade_out(fade_duration)
-            part_b = seg_b[:fade_duration].fade_in(fade_duration)
-            target_transition = part_a.overlay(part_b)
-        
+
+        # Create transition: one vectorized multiply-add on the float32
+        # arrays instead of pydub's per-sample overlay loop
+        if chosen_type == 'hard_cut':
+            cut_samples = int(0.1 * target_sr)
+            target_transition = np.concatenate(
+                (segment_a[-cut_samples // 2:], segment_b[:cut_samples // 2]))
+        else:
+            n = int(natural_transition_sec * target_sr)
+            if chosen_type == 'exp_fade':
+                # Quantize the powers to one decimal so draws hit the cache
+                lo, hi = config.get('exp_fade', {}).get('power_out_range', [1.2, 2.5])
+                power_out = round(random.uniform(lo, hi), 1)
+                lo, hi = config.get('exp_fade', {}).get('power_in_range', [0.4, 0.9])
+                power_in = round(random.uniform(lo, hi), 1)
+                fade_out, fade_in = _make_fades(n, power_out, power_in)
+            else:
+                fade_out, fade_in = _make_fades(n)
+            target_transition = segment_a[-n:] * fade_out + segment_b[:n] * fade_in
+
         # Save files
         os.makedirs(output_dir, exist_ok=True)
-        
-        seg_a.export(os.path.join(output_dir, "source_a.wav"), format="wav")
-        seg_b.export(os.path.join(output_dir, "source_b.wav"), format="wav")
-        target_transition.export(os.path.join(output_dir, "target.wav"), format="wav")
-        
+
+        # FLAC is lossless, ~half the size of PCM WAV, and nearly free to
+        # encode in libsndfile -- so the archive step needs no compressor
+        sf.write(os.path.join(output_dir, "source_a.flac"), segment_a, target_sr, subtype='PCM_16')
+        sf.write(os.path.join(output_dir, "source_b.flac"), segment_b, target_sr, subtype='PCM_16')
+        sf.write(os.path.join(output_dir, "target.flac"), target_transition, target_sr, subtype='PCM_16')
+
         # Save metadata
-        actual_transition_sec = len(target_transition) / 1000.0
+        actual_transition_sec = len(target_transition) / target_sr
         conditioning = {
             "source_a_path": track_a_data['path'],
             "source_b_path": track_b_data['path'],
@@ -286,8 +603,7 @@ def generate_natural_transition(pair, output_dir, config):
             "start_position_b_sec": start_b / sr_b
         }
         
-        with open(os.path.join(output_dir, "conditioning.json"), 'w') as f:
-            json.dump(conditioning, f, indent=2)
+        _dump_json(conditioning, os.path.join(output_dir, "conditioning.json"))
         
         return output_dir
         
@@ -295,23 +611,37 @@ def generate_natural_transition(pair, output_dir, config):
         return None
 
 
+def _generate_one(job):
+    """Unpack and run a single pre-sampled generation job."""
+    pair, output_dir, config, chosen_type, offsets = job
+    return generate_natural_transition(pair, output_dir, config,
+                                       chosen_type, offsets)
+
+
 def generate_full_dataset(config, analysis_files):
     """Generate the complete dataset."""
     print("=" * 60)
     print("GENERATING DATASET")
     print("=" * 60)
     
-    # Load analysis data
+    # Load analysis data: prefer the consolidated Parquet table (one
+    # columnar read) over re-parsing thousands of small JSONs
     print("Loading track analysis data...")
-    analyzer = AudioAnalyzer(target_sr=config['audio']['target_sample_rate'])
-    tracks_data = analyzer.load_analysis_data(analysis_files)
+    parquet_path = os.path.join(config['data']['analysis_dir'], 'analysis.parquet')
+    if os.path.exists(parquet_path):
+        tracks_data = pd.read_parquet(parquet_path).to_dict('records')
+    else:
+        analyzer = AudioAnalyzer(target_sr=config['audio']['target_sample_rate'])
+        tracks_data = analyzer.load_analysis_data(analysis_files)
     print(f"Loaded {len(tracks_data)} track analyses")
     
     # Find compatible pairs
     print("Finding compatible pairs...")
     pairer = TrackPairer(
         tempo_threshold=config['audio']['tempo_threshold'],
-        key_threshold=config['audio']['key_compatibility_threshold']
+        key_threshold=config['audio']['key_compatibility_threshold'],
+        # Segments start anywhere in the track, so require a little slack
+        min_duration=config['audio']['source_segment_length_sec'] + 1.0
     )
     compatible_pairs = pairer.find_compatible_pairs(tracks_data)
     print(f"Found {len(compatible_pairs)} compatible pairs")
@@ -328,63 +658,115 @@ def generate_full_dataset(config, analysis_files):
         # Repeat pairs to reach target
         multiplier = (target_transitions // len(compatible_pairs)) + 1
         compatible_pairs = (compatible_pairs * multiplier)[:target_transitions]
-    
-    random.shuffle(compatible_pairs)
+        # Repeats re-decode the same tracks: enable the per-worker decode
+        # cache and keep pairs grouped by track so consecutive jobs hit it
+        config['dataset']['cache_decoded_tracks'] = True
+        compatible_pairs.sort(key=lambda p: (p[0]['path'], p[1]['path']))
+    else:
+        random.shuffle(compatible_pairs)
     
     print(f"Generating {target_transitions} transitions...")
     print(f"Source segments: {config['audio']['source_segment_length_sec']} seconds each")
     print(f"Output directory: {config['data']['output_dir']}")
     
-    # Generate in batches for memory efficiency
-    batch_size = config['dataset']['batch_size']
+    # Each transition is independent (own output dir, nothing shared), so
+    # fan the work out across all cores
     metadata = []
     generated_count = 0
     failed_count = 0
-    
+
     os.makedirs(config['data']['output_dir'], exist_ok=True)
-    
-    for i in tqdm(range(0, len(compatible_pairs), batch_size), desc="Processing batches"):
-        batch_pairs = compatible_pairs[i:i + batch_size]
-        
-        for pair in tqdm(batch_pairs, desc=f"Batch {i//batch_size + 1}", leave=False):
-            transition_id = f"transition_{generated_count:05d}"
-            output_dir = os.path.join(config['data']['output_dir'], transition_id)
-            
-            result_path = generate_natural_transition(pair, output_dir, config)
-            
+
+    # Pre-sample all randomness in one batch: one rng.choice call builds
+    # the alias table once instead of random.choices rebuilding cumulative
+    # weights per transition, and the run is reproducible from one seed
+    rng = np.random.default_rng(config['dataset'].get('seed'))
+    type_names = [t['name'] for t in config['transitions']['types']]
+    weights = np.array([t['weight'] for t in config['transitions']['types']], dtype=np.float64)
+    type_idx = rng.choice(len(type_names), p=weights / weights.sum(),
+                          size=len(compatible_pairs))
+    offsets = rng.random((len(compatible_pairs), 2))
+
+    # Pre-assign IDs/output dirs so workers stay fully independent
+    jobs = [(pair, os.path.join(config['data']['output_dir'], f"transition_{i:05d}"),
+             config, type_names[type_idx[i]], tuple(offsets[i]))
+            for i, pair in enumerate(compatible_pairs)]
+
+    # Append rows as transitions complete instead of rewriting the whole
+    # CSV every 1000 (that rewrite was quadratic in dataset size)
+    fieldnames = ["id", "path", "transition_type", "transition_length_sec", "avg_tempo"]
+    partial_path = os.path.join(config['data']['output_dir'], "metadata_partial.csv")
+
+    # With the decode cache on, share it across workers through shared
+    # memory: any worker's decode is visible to all, so memory and decode
+    # cost stay 1x instead of per-worker
+    pool_kwargs = {}
+    manager = None
+    if config['dataset'].get('cache_decoded_tracks'):
+        manager = multiprocessing.Manager()
+        shm_index = manager.dict()
+        pool_kwargs = {'initializer': _init_shared_cache,
+                       'initargs': (shm_index, manager.Lock())}
+
+    # Optionally stream finished transitions straight into the archive:
+    # files are tarred while still hot in the page cache and removed, so
+    # packaging needs no second full read of the dataset afterwards
+    archive = None
+    if config['dataset'].get('stream_to_archive'):
+        archive = tarfile.open(config['data']['output_dir'].rstrip('/') + '.tar', 'w')
+        arc_root = os.path.basename(config['data']['output_dir'].rstrip('/'))
+
+    with ProcessPoolExecutor(max_workers=os.cpu_count(), **pool_kwargs) as executor, \
+            open(partial_path, 'w', newline='') as meta_fh:
+        writer = csv.DictWriter(meta_fh, fieldnames=fieldnames)
+        writer.writeheader()
+
+        results = executor.map(_generate_one, jobs, chunksize=8)
+
+        for result_path in tqdm(results, total=len(jobs), desc="Generating transitions"):
             if result_path:
                 # Load conditioning info
                 conditioning_path = os.path.join(result_path, "conditioning.json")
-                with open(conditioning_path, 'r') as f:
-                    conditioning = json.load(f)
-                
-                metadata.append({
-                    "id": transition_id,
+                conditioning = _load_json(conditioning_path)
+
+                row = {
+                    "id": os.path.basename(result_path),
                     "path": result_path,
                     "transition_type": conditioning['transition_type'],
                     "transition_length_sec": conditioning['transition_length_sec'],
                     "avg_tempo": conditioning['avg_tempo']
-                })
+                }
+                metadata.append(row)
+                writer.writerow(row)
                 generated_count += 1
+
+                if archive is not None:
+                    archive.add(result_path,
+                                arcname=os.path.join(arc_root, row['id']))
+                    shutil.rmtree(result_path)
+
+                if generated_count % 1000 == 0:
+                    print(f"Generated {generated_count} transitions so far...")
+                    meta_fh.flush()
             else:
                 failed_count += 1
-            
-            # Save metadata periodically
-            if generated_count % 1000 == 0:
-                print(f"Generated {generated_count} transitions so far...")
-                df = pd.DataFrame(metadata)
-                df.to_csv(os.path.join(config['data']['output_dir'], "metadata_partial.csv"), index=False)
-    
-    # Save final metadata
+
+    if manager is not None:
+        _cleanup_shared_cache(shm_index)
+        manager.shutdown()
+
+    # The partial file already holds every row; promote it in place
     if metadata:
-        df = pd.DataFrame(metadata)
         metadata_path = os.path.join(config['data']['output_dir'], "metadata.csv")
-        df.to_csv(metadata_path, index=False)
-        
-        # Remove partial file
-        partial_path = os.path.join(config['data']['output_dir'], "metadata_partial.csv")
-        if os.path.exists(partial_path):
-            os.remove(partial_path)
+        os.replace(partial_path, metadata_path)
+        if archive is not None:
+            archive.add(metadata_path,
+                        arcname=os.path.join(arc_root, "metadata.csv"))
+    elif os.path.exists(partial_path):
+        os.remove(partial_path)
+    if archive is not None:
+        archive.close()
+        print(f"Dataset archived directly to: {archive.name}")
     
     print(f"\nDataset generation complete!")
     print(f"Successfully generated: {generated_count} transitions")
@@ -424,9 +806,40 @@ def create_download_package(config):
     
     print("Creating compressed archive...")
     archive_path = "/tmp/djnet_dataset_20k"
-    shutil.make_archive(archive_path, 'zip', output_dir)
-    
-    archive_file = f"{archive_path}.zip"
+
+    # Already packaged on the fly by stream_to_archive? Nothing to redo.
+    streamed = output_dir.rstrip('/') + '.tar'
+    if os.path.exists(streamed):
+        size_mb = os.path.getsize(streamed) / (1024 * 1024)
+        print(f"Dataset packaged: {streamed}")
+        print(f"Size: {size_mb:.1f} MB")
+        return streamed
+
+    # Audio is already FLAC-compressed, so an uncompressed tar is enough;
+    # fall through to multi-threaded compressors only for WAV datasets
+    parent_dir, basename = os.path.split(output_dir.rstrip('/'))
+    has_flac = bool(glob.glob(os.path.join(output_dir, '*', '*.flac')))
+    if has_flac:
+        archive_file = f"{archive_path}.tar"
+        subprocess.run(
+            ['tar', '-cf', archive_file, '-C', parent_dir, basename],
+            check=True)
+    elif shutil.which('zstd'):
+        archive_file = f"{archive_path}.tar.zst"
+        subprocess.run(
+            ['tar', '--use-compress-program=zstd -T0 --long=27',
+             '-cf', archive_file, '-C', parent_dir, basename],
+            check=True)
+    elif shutil.which('pigz'):
+        archive_file = f"{archive_path}.tar.gz"
+        subprocess.run(
+            ['tar', '--use-compress-program=pigz',
+             '-cf', archive_file, '-C', parent_dir, basename],
+            check=True)
+    else:
+        shutil.make_archive(archive_path, 'zip', output_dir)
+        archive_file = f"{archive_path}.zip"
+
     size_mb = os.path.getsize(archive_file) / (1024 * 1024)
     
     print(f"Dataset packaged: {archive_file}")
@@ -436,40 +849,80 @@ def create_download_package(config):
     return archive_file
 
 
-def create_upload_instructions(dataset_dir, archive_file):
-    """Create scripts and instructions for uploading to Google Drive."""
-    
+def create_upload_instructions(dataset_dir, archive_file=None):
+    """Create scripts and instructions for uploading to Google Drive.
+
+    With archive_file=None the generated script streams the dataset
+    straight into rclone rcat (tar | zstd | rclone), so the full ~dataset
+    is never written to and re-read from /tmp before the upload.
+    """
+
     # Create rclone upload script
     rclone_script = f'''#!/bin/bash
 # Upload DJNet dataset to Google Drive using rclone
 
-ARCHIVE_FILE="{archive_file}"
+ARCHIVE_FILE="{archive_file or ''}"
+DATASET_DIR="{dataset_dir.rstrip('/')}"
 GDRIVE_PATH="gdrive:DJNet_Dataset/"
 
 echo "📤 Starting upload to Google Drive..."
-echo "📋 File: $ARCHIVE_FILE"
 echo "🎯 Destination: $GDRIVE_PATH"
 echo "⚠️  This will take several hours for large datasets"
 
-# Upload with progress and resume capability
-rclone copy "$ARCHIVE_FILE" "$GDRIVE_PATH" \\
-    --progress \\
-    --transfers 4 \\
-    --checkers 8 \\
-    --retries 3 \\
-    --low-level-retries 10 \\
-    --stats 30s \\
-    --stats-one-line
-
-echo "✅ Upload complete!"
-echo "📋 File uploaded to: $GDRIVE_PATH$(basename "$ARCHIVE_FILE")"
-
-# Clean up local archive file after successful upload
-read -p "🗑️  Delete local archive file? (y/N): " -n 1 -r
-echo
-if [[ $REPLY =~ ^[Yy]$ ]]; then
-    rm -f "$ARCHIVE_FILE"
-    echo "✅ Local archive deleted"
+if [ -n "$ARCHIVE_FILE" ] && [ -f "$ARCHIVE_FILE" ]; then
+    echo "📋 File: $ARCHIVE_FILE"
+
+    # Hash in the background while rclone reads the same file: the
+    # page cache is shared, so the integrity pass overlaps the upload
+    # instead of re-reading the archive afterwards. SHA-256 uses the
+    # CPU's SHA extensions via OpenSSL, unlike software MD5
+    sha256sum "$ARCHIVE_FILE" > "$ARCHIVE_FILE.sha256" &
+    HASH_PID=$!
+
+    # Upload with progress and resume capability
+    rclone copy "$ARCHIVE_FILE" "$GDRIVE_PATH" \\
+        --rc --rc-addr localhost:5572 \\
+        --progress \\
+        --transfers 4 \\
+        --checkers 8 \\
+        --retries 3 \\
+        --low-level-retries 10 \\
+        --stats 30s \\
+        --stats-one-line
+
+    wait $HASH_PID
+    echo "✅ Upload complete!"
+    echo "📋 File uploaded to: $GDRIVE_PATH$(basename "$ARCHIVE_FILE")"
+    echo "🔐 SHA-256: $(cut -d' ' -f1 "$ARCHIVE_FILE.sha256")"
+
+    # Clean up local archive file after successful upload
+    read -p "🗑️  Delete local archive file? (y/N): " -n 1 -r
+    echo
+    if [[ $REPLY =~ ^[Yy]$ ]]; then
+        rm -f "$ARCHIVE_FILE"
+        echo "✅ Local archive deleted"
+    fi
+else
+    echo "📋 Streaming: $DATASET_DIR (no local archive)"
+
+    # Stream tar -> zstd -> rclone: compression overlaps the upload and
+    # no archive copy ever touches local disk. The tee branch hashes
+    # the exact bytes rclone sends, so integrity verification costs no
+    # extra pass over the dataset
+    tar -C "$(dirname "$DATASET_DIR")" -cf - "$(basename "$DATASET_DIR")" \\
+        | zstd -T0 \\
+        | tee >(sha256sum | cut -d' ' -f1 > "$DATASET_DIR.tar.zst.sha256") \\
+        | rclone rcat "$GDRIVE_PATH"djnet_dataset.tar.zst \\
+            --rc --rc-addr localhost:5572 \\
+            --retries 3 \\
+            --low-level-retries 10 \\
+            --stats 30s \\
+            --stats-one-line
+
+    echo "✅ Upload complete!"
+    echo "📋 File uploaded to: $GDRIVE_PATH"djnet_dataset.tar.zst
+    echo "🔐 SHA-256: $(cat "$DATASET_DIR.tar.zst.sha256")"
+    echo "   Verify remotely with: rclone hashsum sha256 "$GDRIVE_PATH"djnet_dataset.tar.zst"
 fi
 
 echo "🎉 All done!"
@@ -481,14 +934,20 @@ echo "🎉 All done!"
     os.chmod(upload_script_path, 0o755)
     
     # Create comprehensive instructions
-    archive_size_gb = os.path.getsize(archive_file) / (1024**3)
+    if archive_file:
+        archive_size_gb = os.path.getsize(archive_file) / (1024**3)
+    else:
+        archive_size_gb = sum(
+            os.path.getsize(os.path.join(root, name))
+            for root, _, files in os.walk(dataset_dir)
+            for name in files) / (1024**3)
     
     instructions = f'''
 🎉 DJNet Dataset Generation Complete!
 
 📊 Dataset Information:
    Dataset Location: {dataset_dir}
-   Archive Location: {archive_file}
+   Archive Location: {archive_file or '(streamed directly, no local archive)'}
    Archive Size: {archive_size_gb:.2f} GB
    Upload Estimated Time: {archive_size_gb * 0.5:.1f} - {archive_size_gb * 2:.1f} hours
 
@@ -523,8 +982,8 @@ echo "🎉 All done!"
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 
 1. Go to drive.google.com
-2. Click "New" → "File upload"  
-3. Select: {archive_file}
+2. Click "New" → "File upload"
+3. Select: {archive_file or dataset_dir}
 4. Wait for upload completion
 
 ⚠️  IMPORTANT NOTES:
@@ -583,18 +1042,23 @@ def main():
             print("ERROR: No transitions were generated!")
             return
         
-        # Step 4: Create download package
-        archive_file = create_download_package(config)
-        
-        # Step 5: Create upload instructions
-        create_upload_instructions(config['data']['output_dir'], archive_file)
+        # Step 4/5: Package and upload instructions. When rclone is
+        # installed, skip the local archive entirely -- the upload
+        # script streams tar | zstd straight into rclone rcat, saving a
+        # full write + re-read of the dataset on /tmp
+        if shutil.which('rclone'):
+            archive_file = None
+            create_upload_instructions(config['data']['output_dir'])
+        else:
+            archive_file = create_download_package(config)
+            create_upload_instructions(config['data']['output_dir'], archive_file)
         
         print("\n" + "=" * 60)
         print("GENERATION COMPLETE!")
         print("=" * 60)
         print(f"Generated {len(metadata)} transitions")
         print(f"Dataset location: {config['data']['output_dir']}")
-        print(f"Archive: {archive_file}")
+        print(f"Archive: {archive_file or 'streamed via rclone (see upload script)'}")
         print("Check /tmp/upload_instructions.txt for Google Drive upload options!")
         print("Ready for download from vast.ai instance!")
         
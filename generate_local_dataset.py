@@ -8,20 +8,46 @@ No need for cloud instances or uploads - everything stays local.
 
 import os
 import sys
+import csv
 import time
 import yaml
 import json
 import random
+import hashlib
+import tempfile
+
+# Share one numba disk cache across the pool workers so librosa's JIT
+# kernels compile once instead of once per process (must be set before
+# librosa is imported)
+os.environ.setdefault('NUMBA_CACHE_DIR',
+                      os.path.join(tempfile.gettempdir(), 'numba_cache'))
+
 import requests
 import zipfile
-import glob
 import shutil
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from tqdm import tqdm
-import pandas as pd
 import numpy as np
 import librosa
-from pydub import AudioSegment
+import soundfile as sf
+
+try:
+    import soxr
+except ImportError:  # fall back to librosa's resampler
+    soxr = None
+
+try:
+    from stream_unzip import stream_unzip
+except ImportError:  # fall back to download-then-extract
+    stream_unzip = None
+
+try:
+    import orjson
+except ImportError:  # fall back to stdlib json
+    orjson = None
 
 # Add src to path
 sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
@@ -42,6 +68,7 @@ def create_local_config(data_dir="./data", output_dir="./output/djnet_dataset_20
             'music_dir': os.path.join(data_dir, 'fma_small'),
             'analysis_dir': os.path.join(data_dir, 'track_analysis'),
             'output_dir': output_dir,
+            'pcm_cache_dir': os.path.join(data_dir, 'pcm_cache'),
             'fma_url': 'https://os.unil.cloud.switch.ch/fma/fma_small.zip'
         },
         'audio': {
@@ -66,7 +93,11 @@ def create_local_config(data_dir="./data", output_dir="./output/djnet_dataset_20
         'dataset': {
             'num_transitions': 20000,
             'shuffle_pairs': True,
-            'minimum_valid_starts': 3
+            'minimum_valid_starts': 3,
+            # Fixed shuffle seed keeps the pair-to-transition-ID mapping
+            # stable across restarts, so resume can trust existing
+            # conditioning.json files
+            'seed': 42
         }
     }
 
@@ -90,7 +121,32 @@ def download_fma_dataset(config):
     # Download with progress
     response = requests.get(fma_url, stream=True)
     total_size = int(response.headers.get('content-length', 0))
-    
+
+    if stream_unzip is not None:
+        # Extract members straight out of the HTTP stream: the 8 GB zip
+        # never hits disk, halving total writes versus download+extract
+        extract_dir = os.path.dirname(music_dir)
+        with tqdm(desc="Downloading + extracting FMA", total=total_size,
+                  unit='B', unit_scale=True, unit_divisor=1024) as pbar:
+            def chunks():
+                for chunk in response.iter_content(chunk_size=1 << 20):
+                    if chunk:
+                        pbar.update(len(chunk))
+                        yield chunk
+
+            for file_name, _, unzipped_chunks in stream_unzip(chunks()):
+                target = os.path.join(extract_dir, file_name.decode())
+                if target.endswith('/'):
+                    for _ in unzipped_chunks:
+                        pass
+                    continue
+                os.makedirs(os.path.dirname(target), exist_ok=True)
+                with open(target, 'wb') as f:
+                    for data in unzipped_chunks:
+                        f.write(data)
+        print(f"✅ FMA dataset ready at {music_dir}")
+        return music_dir
+
     with open(zip_path, 'wb') as f, tqdm(
         desc="Downloading FMA",
         total=total_size,
@@ -102,52 +158,121 @@ def download_fma_dataset(config):
             if chunk:
                 f.write(chunk)
                 pbar.update(len(chunk))
-    
-    # Extract
+
+    # Extract: MP3 members are stored uncompressed and writes release the
+    # GIL, so a thread pool with per-thread ZipFile handles scales on SSD
     print("📦 Extracting dataset...")
+    extract_dir = os.path.dirname(music_dir)
+    local = threading.local()
+
+    def _extract_member(name):
+        if not hasattr(local, 'zf'):
+            local.zf = zipfile.ZipFile(zip_path, 'r')
+        local.zf.extract(name, extract_dir)
+
     with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-        zip_ref.extractall(os.path.dirname(music_dir))
-    
+        names = zip_ref.namelist()
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(tqdm(executor.map(_extract_member, names),
+                  total=len(names), desc="Extracting"))
+
     # Clean up zip file
     os.remove(zip_path)
     print(f"✅ FMA dataset ready at {music_dir}")
     return music_dir
 
 
+def _limit_worker_threads():
+    """Pin BLAS/numba to one thread per worker to avoid oversubscription."""
+    os.environ['OMP_NUM_THREADS'] = '1'
+    os.environ['NUMBA_NUM_THREADS'] = '1'
+
+
+def iter_audio_files(root, suffix='.mp3'):
+    """Yield audio file paths under root via os.scandir.
+
+    Skips the per-entry fnmatch and path assembly that
+    glob.glob('**/*.mp3', recursive=True) pays on the FMA tree.
+    """
+    try:
+        with os.scandir(root) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    yield from iter_audio_files(entry.path, suffix)
+                elif entry.name.endswith(suffix):
+                    yield entry.path
+    except OSError:
+        pass
+
+
+def _analyze_one(job):
+    """Analyze one track in a worker process and write its JSON.
+
+    Returns (output_path, analysis_data) so the parent can build the
+    analysis.jsonl manifest without re-reading the per-track files.
+    """
+    audio_file, analysis_dir, target_sr = job
+    try:
+        analyzer = AudioAnalyzer(target_sr=target_sr)
+        analysis_data = analyzer.analyze_track(audio_file)
+        if not analysis_data:
+            return None
+        base_name = os.path.splitext(os.path.basename(audio_file))[0]
+        output_path = os.path.join(analysis_dir, f"{base_name}.json")
+        with open(output_path, 'w') as f:
+            json.dump(analysis_data, f, indent=2)
+        return output_path, analysis_data
+    except Exception as e:
+        print(f"Error analyzing {audio_file}: {str(e)[:100]}...")
+        return None
+
+
 def analyze_tracks(config):
     """Analyze all audio tracks."""
     print("🔍 Analyzing audio tracks...")
-    
-    analyzer = AudioAnalyzer(target_sr=config['audio']['target_sample_rate'])
+
     music_dir = config['data']['music_dir']
     analysis_dir = config['data']['analysis_dir']
-    
+
     # Get all audio files
-    audio_files = glob.glob(os.path.join(music_dir, '**/*.mp3'), recursive=True)
+    audio_files = list(iter_audio_files(music_dir))
     print(f"Found {len(audio_files)} audio files")
-    
+
     if len(audio_files) == 0:
         print("❌ No audio files found! Check the music directory path.")
         return []
-    
+
     os.makedirs(analysis_dir, exist_ok=True)
     analysis_files = []
-    
-    # Analyze tracks with progress
-    for audio_file in tqdm(audio_files, desc="Analyzing tracks"):
-        try:
-            analysis_data = analyzer.analyze_track(audio_file)
-            if analysis_data:
-                base_name = os.path.splitext(os.path.basename(audio_file))[0]
-                output_path = os.path.join(analysis_dir, f"{base_name}.json")
-                
-                with open(output_path, 'w') as f:
-                    json.dump(analysis_data, f, indent=2)
+
+    # Analysis is CPU-bound and per-file independent: fan it out over all
+    # cores, one AudioAnalyzer per worker
+    jobs = [(f, analysis_dir, config['audio']['target_sample_rate'])
+            for f in audio_files]
+
+    # Warm librosa's numba kernels once in the parent: forked workers
+    # inherit the compiled code in memory and the rest hits the shared
+    # NUMBA_CACHE_DIR instead of re-JITting per process
+    sr = config['audio']['target_sample_rate']
+    librosa.beat.beat_track(y=np.zeros(sr, dtype=np.float32), sr=sr)
+
+    # One JSONL manifest alongside the per-track files: pairing later
+    # reads one file instead of opening thousands of small JSONs
+    manifest_path = os.path.join(analysis_dir, "analysis.jsonl")
+
+    with ProcessPoolExecutor(max_workers=os.cpu_count(),
+                             initializer=_limit_worker_threads) as executor, \
+            open(manifest_path, 'wb') as manifest:
+        results = executor.map(_analyze_one, jobs, chunksize=16)
+        for result in tqdm(results, total=len(jobs), desc="Analyzing tracks"):
+            if result:
+                output_path, analysis_data = result
                 analysis_files.append(output_path)
-        except Exception as e:
-            print(f"Error analyzing {audio_file}: {str(e)[:100]}...")
-            continue
-    
+                if orjson is not None:
+                    manifest.write(orjson.dumps(analysis_data) + b'\n')
+                else:
+                    manifest.write(json.dumps(analysis_data).encode() + b'\n')
+
     print(f"✅ Analysis complete! Generated {len(analysis_files)} analysis files")
     return analysis_files
 
@@ -156,12 +281,24 @@ def find_compatible_pairs(analysis_files, config):
     """Find compatible track pairs."""
     print("🔗 Finding compatible track pairs...")
     
-    analyzer = AudioAnalyzer(target_sr=config['audio']['target_sample_rate'])
-    tracks_data = analyzer.load_analysis_data(analysis_files)
-    
+    # Prefer the single JSONL manifest written by analyze_tracks: one
+    # open() and a C-extension parser when orjson is installed, instead
+    # of thousands of per-file stdlib json loads
+    manifest_path = os.path.join(config['data']['analysis_dir'], "analysis.jsonl")
+    if os.path.exists(manifest_path):
+        loads = orjson.loads if orjson is not None else json.loads
+        with open(manifest_path, 'rb') as f:
+            tracks_data = [loads(line) for line in f]
+    else:
+        analyzer = AudioAnalyzer(target_sr=config['audio']['target_sample_rate'])
+        tracks_data = analyzer.load_analysis_data(analysis_files)
+
     pairer = TrackPairer(
         tempo_threshold=config['audio']['tempo_threshold'],
-        key_threshold=config['audio']['key_compatibility_threshold']
+        key_threshold=config['audio']['key_compatibility_threshold'],
+        # Tracks shorter than a source segment fail after a full decode
+        # in generate_single_transition; drop them before pairing
+        min_duration=config['audio']['source_segment_length_sec'] + 1.0
     )
     compatible_pairs = pairer.find_compatible_pairs(tracks_data)
     
@@ -183,46 +320,47 @@ def find_compatible_pairs(analysis_files, config):
     return compatible_pairs
 
 
-def generate_single_transition(pair, output_dir, config):
-    """Generate a single transition with natural duration."""
+def generate_single_transition(pair, output_dir, config,
+                               chosen_type=None, offsets=None):
+    """Generate a single transition with natural duration.
+
+    chosen_type and offsets (start fractions) are normally pre-sampled
+    in one batch by generate_transitions; when omitted, the function
+    draws its own for standalone use.
+    """
     track_a_data, track_b_data = pair
     source_length_sec = config['audio']['source_segment_length_sec']
     target_sr = config['audio']['target_sample_rate']
-    
+
+    # Resume support: a finished transition already has conditioning.json
+    # on disk, so hand that back instead of re-decoding and re-writing
+    conditioning_path = os.path.join(output_dir, "conditioning.json")
+    if os.path.exists(conditioning_path):
+        loads = orjson.loads if orjson is not None else json.loads
+        with open(conditioning_path, 'rb') as f:
+            return loads(f.read())
+
     try:
-        # Load audio files
-        y_a, sr_a = librosa.load(track_a_data['path'], sr=None, mono=True)
-        y_b, sr_b = librosa.load(track_b_data['path'], sr=None, mono=True)
-        
-        # Calculate required samples
-        source_samples_a = int(source_length_sec * sr_a)
-        source_samples_b = int(source_length_sec * sr_b)
-        
-        # Check if tracks are long enough
-        if len(y_a) < source_samples_a or len(y_b) < source_samples_b:
-            return None
-        
-        # Find valid start positions
-        max_start_a = len(y_a) - source_samples_a
-        max_start_b = len(y_b) - source_samples_b
-        
-        if max_start_a <= 0 or max_start_b <= 0:
+        # Double-buffer the two decodes: source_b decodes on a background
+        # thread (libsndfile releases the GIL) while this thread decodes
+        # and resamples source_a, hiding one decode behind compute
+        frac_a, frac_b = offsets if offsets is not None else (None, None)
+        future_b = _decode_executor().submit(
+            _load_segment, track_b_data['path'], source_length_sec, config, frac_b)
+        segment_a, sr_a, start_a = _load_segment(
+            track_a_data['path'], source_length_sec, config, frac_a)
+
+        if segment_a is not None and sr_a != target_sr:
+            segment_a = _resample(segment_a, sr_a, target_sr)
+
+        segment_b, sr_b, start_b = future_b.result()
+
+        if segment_a is None or segment_b is None:
             return None
-        
-        # Choose random start positions
-        start_a = random.randint(0, max_start_a)
-        start_b = random.randint(0, max_start_b)
-        
-        # Extract segments
-        segment_a = y_a[start_a:start_a + source_samples_a]
-        segment_b = y_b[start_b:start_b + source_samples_b]
-        
-        # Resample if needed
-        if sr_a != target_sr:
-            segment_a = librosa.resample(segment_a, orig_sr=sr_a, target_sr=target_sr)
+
         if sr_b != target_sr:
-            segment_b = librosa.resample(segment_b, orig_sr=sr_b, target_sr=target_sr)
-        
+            segment_b = _resample(segment_b, sr_b, target_sr)
+
         # Ensure exact length
         source_target_samples = int(source_length_sec * target_sr)
         
@@ -236,17 +374,11 @@ def generate_single_transition(pair, output_dir, config):
         else:
             segment_b = segment_b[:source_target_samples]
         
-        # Convert to AudioSegment
-        segment_a_int = (segment_a * 32767).astype(np.int16)
-        segment_b_int = (segment_b * 32767).astype(np.int16)
-        
-        seg_a = AudioSegment(segment_a_int.tobytes(), frame_rate=target_sr, sample_width=2, channels=1)
-        seg_b = AudioSegment(segment_b_int.tobytes(), frame_rate=target_sr, sample_width=2, channels=1)
-        
         # Generate transition
-        transition_weights = [t['weight'] for t in config['transitions']['types']]
-        transition_type_names = [t['name'] for t in config['transitions']['types']]
-        chosen_type = random.choices(transition_type_names, weights=transition_weights, k=1)[0]
+        if chosen_type is None:
+            transition_type_names, transition_weights = _type_choices(
+                tuple((t['name'], t['weight']) for t in config['transitions']['types']))
+            chosen_type = random.choices(transition_type_names, weights=transition_weights, k=1)[0]
         
         # Calculate natural transition duration
         avg_tempo = (track_a_data.get('tempo', 120) + track_b_data.get('tempo', 120)) / 2
@@ -256,34 +388,36 @@ def generate_single_transition(pair, output_dir, config):
         beats_in_transition = transition_bars * beats_per_bar
         natural_transition_sec = (beats_in_transition / avg_tempo) * 60
         natural_transition_sec = max(2.0, min(8.0, natural_transition_sec))
-        natural_transition_ms = int(natural_transition_sec * 1000)
-        
-        # Create transition
+
+        # Create transition: one vectorized multiply-add on the float32
+        # arrays instead of pydub's per-sample fade/overlay passes
         if chosen_type == 'hard_cut':
-            cut_duration = 100
-            part_a = seg_a[-cut_duration//2:]
-            part_b = seg_b[:cut_duration//2]
-            target_transition = part_a + part_b
+            cut_samples = int(0.1 * target_sr)
+            target_transition = np.concatenate(
+                (segment_a[-cut_samples // 2:], segment_b[:cut_samples // 2]))
         else:
-            # All other types use fade
-            fade_duration = natural_transition_ms
-            part_a = seg_a[-fade_duration:].fade_out(fade_duration)
-            part_b = seg_b[:fade_duration].fade_in(fade_duration)
-            target_transition = part_a.overlay(part_b)
-        
+            n = int(natural_transition_sec * target_sr)
+            kind = 'exp' if chosen_type == 'exp_fade' else 'linear'
+            fade_out, fade_in = _make_ramps(n, kind)
+            # Accumulate in place so the mix costs one float32 buffer,
+            # not three
+            target_transition = segment_a[-n:] * fade_out
+            target_transition += segment_b[:n] * fade_in
+
         # Save files
         os.makedirs(output_dir, exist_ok=True)
-        
-        seg_a.export(os.path.join(output_dir, "source_a.wav"), format="wav")
-        seg_b.export(os.path.join(output_dir, "source_b.wav"), format="wav")
-        target_transition.export(os.path.join(output_dir, "target.wav"), format="wav")
+
+        # One libsndfile call per file; no pydub round-trip
+        sf.write(os.path.join(output_dir, "source_a.wav"), segment_a, target_sr, subtype='PCM_16')
+        sf.write(os.path.join(output_dir, "source_b.wav"), segment_b, target_sr, subtype='PCM_16')
+        sf.write(os.path.join(output_dir, "target.wav"), target_transition, target_sr, subtype='PCM_16')
         
         # Save conditioning info
         conditioning = {
             "source_a_path": track_a_data['path'],
             "source_b_path": track_b_data['path'],
             "source_segment_length_sec": source_length_sec,
-            "transition_length_sec": len(target_transition) / 1000.0,
+            "transition_length_sec": len(target_transition) / target_sr,
             "natural_transition_sec": natural_transition_sec,
             "sample_rate": target_sr,
             "transition_type": chosen_type,
@@ -295,78 +429,289 @@ def generate_single_transition(pair, output_dir, config):
         
         with open(os.path.join(output_dir, "conditioning.json"), 'w') as f:
             json.dump(conditioning, f, indent=2)
-        
-        return output_dir
-        
+
+        return conditioning
+
     except Exception as e:
         return None
 
 
+_decode_pool = None
+
+
+def _decode_executor():
+    """One-thread prefetch pool, created lazily per worker process."""
+    global _decode_pool
+    if _decode_pool is None:
+        _decode_pool = ThreadPoolExecutor(max_workers=1)
+    return _decode_pool
+
+
+def _load_segment(path, segment_length_sec, config, start_frac=None):
+    """Read a segment from the mmap cache, else decode just the window."""
+    cached = _read_cached_segment(path, segment_length_sec, config, start_frac)
+    if cached is not None:
+        return cached
+    return _read_random_segment(path, segment_length_sec, start_frac)
+
+
+@lru_cache(maxsize=8)
+def _type_choices(types_key):
+    """Memoized (names, weights) lists from a ((name, weight), ...) key."""
+    return [name for name, _ in types_key], [w for _, w in types_key]
+
+
+@lru_cache(maxsize=128)
+def _make_ramps(n, kind='linear'):
+    """Memoized (fade_out, fade_in) ramps; lengths repeat across a run."""
+    t = np.linspace(0.0, 1.0, n, dtype=np.float32)
+    if kind == 'exp':
+        fade_out = np.exp(-4.0 * t, dtype=np.float32)
+        fade_in = 1.0 - fade_out
+    else:
+        fade_out = 1.0 - t
+        fade_in = t
+    return fade_out, fade_in
+
+
+def _pcm_cache_path(cache_dir, path):
+    """Cache file for a track's decoded PCM, keyed by a path hash."""
+    digest = hashlib.md5(path.encode()).hexdigest()
+    return os.path.join(cache_dir, f"{digest}.npy")
+
+
+def _precache_one(job):
+    """Decode+resample one track to int16 NPY in a worker process."""
+    path, cache_dir, target_sr = job
+    cache_path = _pcm_cache_path(cache_dir, path)
+    if os.path.exists(cache_path):
+        return cache_path
+    try:
+        try:
+            data, sr = sf.read(path, dtype='float32', always_2d=True)
+            y = data[:, 0] if data.shape[1] == 1 else data.mean(axis=1)
+        except sf.LibsndfileError:
+            y, sr = librosa.load(path, sr=None, mono=True)
+        if sr != target_sr:
+            y = _resample(y, sr, target_sr)
+        # int16 halves the cache bytes and mmaps cache-friendly
+        np.save(cache_path, (np.clip(y, -1.0, 1.0) * 32767).astype(np.int16))
+        return cache_path
+    except Exception:
+        return None
+
+
+def precache_audio(compatible_pairs, config):
+    """Decode every paired track once into a memory-mappable NPY.
+
+    Tracks appear in many pairs, so paying the MP3 decode once and
+    mmap-slicing afterwards removes the dominant per-transition cost.
+    """
+    cache_dir = config['data']['pcm_cache_dir']
+    target_sr = config['audio']['target_sample_rate']
+    os.makedirs(cache_dir, exist_ok=True)
+
+    unique_paths = sorted({t['path'] for pair in compatible_pairs for t in pair})
+    jobs = [(p, cache_dir, target_sr) for p in unique_paths]
+
+    with ProcessPoolExecutor(max_workers=os.cpu_count(),
+                             initializer=_limit_worker_threads) as executor:
+        results = executor.map(_precache_one, jobs, chunksize=4)
+        cached = sum(1 for r in tqdm(results, total=len(jobs),
+                                     desc="Caching decoded tracks") if r)
+    print(f"✅ Cached {cached}/{len(unique_paths)} decoded tracks")
+
+
+def _read_cached_segment(path, segment_length_sec, config, start_frac=None):
+    """Slice a random window out of the mmap'd PCM cache, if present."""
+    cache_path = _pcm_cache_path(config['data']['pcm_cache_dir'], path)
+    if not os.path.exists(cache_path):
+        return None
+    target_sr = config['audio']['target_sample_rate']
+    arr = np.load(cache_path, mmap_mode='r')
+    need = int(segment_length_sec * target_sr)
+    max_start = len(arr) - need
+    if max_start <= 0:
+        return (None, None, None)
+    start = (int(start_frac * max_start) if start_frac is not None
+             else random.randint(0, max_start))
+    segment = arr[start:start + need].astype(np.float32) * (1.0 / 32768)
+    return segment, target_sr, start
+
+
+def _read_random_segment(path, segment_length_sec, start_frac=None):
+    """Seek to a random window and decode only those frames.
+
+    Avoids decoding whole MP3s just to keep 20 seconds of them. If
+    start_frac (0..1) is given, the start position is deterministic so
+    callers can pre-sample all randomness in one batch.
+
+    Returns:
+        Tuple of (mono float32 samples, sample rate, start frame), or
+        (None, None, None) if the track is too short.
+    """
+    try:
+        with sf.SoundFile(path) as f:
+            need = int(segment_length_sec * f.samplerate)
+            max_start = f.frames - need
+            if max_start <= 0:
+                return None, None, None
+            start = (int(start_frac * max_start) if start_frac is not None
+                     else random.randint(0, max_start))
+            f.seek(start)
+            data = f.read(need, dtype='float32', always_2d=True)
+            mono = data[:, 0] if data.shape[1] == 1 else data.mean(axis=1)
+            return mono, f.samplerate, start
+    except sf.LibsndfileError:
+        # libsndfile without MP3 support; decode the whole file instead
+        y, sr = librosa.load(path, sr=None, mono=True)
+        need = int(segment_length_sec * sr)
+        max_start = len(y) - need
+        if max_start <= 0:
+            return None, None, None
+        start = (int(start_frac * max_start) if start_frac is not None
+                 else random.randint(0, max_start))
+        return y[start:start + need], sr, start
+
+
+# One ResampleStream per (in_rate, out_rate) per process: FMA has only a
+# handful of native rates, so the polyphase filter is designed once and
+# reused instead of being rebuilt on every call
+_resamplers = {}
+
+
+def _resample(data, orig_sr, target_sr):
+    """Resample audio, preferring the SIMD soxr kernels when available."""
+    if soxr is not None:
+        stream = _resamplers.get((orig_sr, target_sr))
+        if stream is None:
+            stream = soxr.ResampleStream(orig_sr, target_sr, 1,
+                                         dtype='float32', quality='HQ')
+            _resamplers[(orig_sr, target_sr)] = stream
+        out = stream.resample_chunk(np.asarray(data, dtype=np.float32),
+                                    last=True)
+        stream.clear()
+        return out
+    return librosa.resample(data, orig_sr=orig_sr, target_sr=target_sr)
+
+
+def _generate_one(job):
+    """Unpack and run a single pre-sampled generation job."""
+    pair, output_dir, config, chosen_type, offsets = job
+    return generate_single_transition(pair, output_dir, config,
+                                      chosen_type, offsets)
+
+
 def generate_transitions(compatible_pairs, config):
     """Generate all transitions with progress tracking."""
     print("🎼 Generating transitions...")
-    
+
     output_dir = config['data']['output_dir']
     num_to_generate = min(len(compatible_pairs), config['dataset']['num_transitions'])
-    
+
+    # One-time decode of every paired track into the mmap cache
+    precache_audio(compatible_pairs[:num_to_generate], config)
+
     if config['dataset']['shuffle_pairs']:
-        random.shuffle(compatible_pairs)
-    
+        # Seeded shuffle keeps the pair -> transition_NNNNN mapping
+        # stable across restarts, which is what makes resume correct
+        random.Random(config['dataset'].get('seed')).shuffle(compatible_pairs)
+
     metadata = []
     generated_count = 0
     failed_count = 0
-    
+
     # Create progress tracking
     progress_file = os.path.join(output_dir, "progress.json")
-    
-    with tqdm(total=num_to_generate, desc="Generating transitions") as pbar:
-        for i, pair in enumerate(compatible_pairs[:num_to_generate]):
-            transition_id = f"transition_{generated_count:05d}"
-            transition_output_dir = os.path.join(output_dir, transition_id)
-            
-            result_path = generate_single_transition(pair, transition_output_dir, config)
-            
-            if result_path:
-                # Get transition info
-                conditioning_path = os.path.join(result_path, "conditioning.json")
-                with open(conditioning_path, 'r') as f:
-                    conditioning = json.load(f)
-                
-                metadata.append({
-                    "id": transition_id,
-                    "path": result_path,
-                    "transition_type": conditioning['transition_type'],
-                    "transition_length_sec": conditioning['transition_length_sec'],
-                    "avg_tempo": conditioning.get('avg_tempo', 0)
-                })
-                generated_count += 1
-            else:
-                failed_count += 1
-            
-            pbar.update(1)
-            
-            # Save progress every 100 transitions
-            if (generated_count + failed_count) % 100 == 0:
-                progress_data = {
-                    "generated": generated_count,
-                    "failed": failed_count,
-                    "total_attempted": generated_count + failed_count,
-                    "target": num_to_generate,
-                    "timestamp": time.time()
-                }
-                with open(progress_file, 'w') as f:
-                    json.dump(progress_data, f, indent=2)
-                
-                # Save partial metadata
-                if metadata:
-                    partial_df = pd.DataFrame(metadata)
-                    partial_df.to_csv(os.path.join(output_dir, "metadata_partial.csv"), index=False)
-    
-    # Save final metadata
+
+    # Pre-sample all randomness in one batch: a single rng.choice call
+    # replaces per-transition random.choices weight rebuilds, and runs
+    # become reproducible from one dataset.seed value
+    rng = np.random.default_rng(config['dataset'].get('seed'))
+    type_names = [t['name'] for t in config['transitions']['types']]
+    weights = np.array([t['weight'] for t in config['transitions']['types']], dtype=np.float64)
+    type_idx = rng.choice(len(type_names), p=weights / weights.sum(),
+                          size=num_to_generate)
+    offsets = rng.random((num_to_generate, 2))
+
+    # Each pair is independent, so fan the decode/resample/fade work out
+    # across all cores. Output dirs are pre-assigned per attempt so the
+    # workers never contend; IDs of failed attempts are simply skipped.
+    jobs = [(pair, os.path.join(output_dir, f"transition_{i:05d}"), config,
+             type_names[type_idx[i]], tuple(offsets[i]))
+            for i, pair in enumerate(compatible_pairs[:num_to_generate])]
+
+    # Append-only size log: the monitor tails this instead of re-walking
+    # the whole output tree every tick
+    sizes_file = os.path.join(output_dir, "sizes.jsonl")
+
+    # Stream metadata rows to disk as they arrive instead of
+    # re-serializing the whole growing table every 100 transitions
+    partial_path = os.path.join(output_dir, "metadata_partial.csv")
+    fieldnames = ["id", "path", "transition_type",
+                  "transition_length_sec", "avg_tempo"]
+    last_progress_save = time.monotonic()
+
+    with ProcessPoolExecutor(max_workers=os.cpu_count(),
+                             initializer=_limit_worker_threads) as executor, \
+            open(sizes_file, 'a') as sizes_f, \
+            open(partial_path, 'w', newline='') as meta_fh:
+        writer = csv.DictWriter(meta_fh, fieldnames=fieldnames)
+        writer.writeheader()
+
+        results = executor.map(_generate_one, jobs, chunksize=16)
+
+        with tqdm(total=num_to_generate, desc="Generating transitions") as pbar:
+            for i, conditioning in enumerate(results):
+                if conditioning:
+                    transition_id = f"transition_{i:05d}"
+                    transition_dir = os.path.join(output_dir, transition_id)
+                    # Workers return the conditioning dict directly; no
+                    # need to re-read the JSON they just wrote
+                    row = {
+                        "id": transition_id,
+                        "path": transition_dir,
+                        "transition_type": conditioning['transition_type'],
+                        "transition_length_sec": conditioning['transition_length_sec'],
+                        "avg_tempo": conditioning.get('avg_tempo', 0)
+                    }
+                    metadata.append(row)
+                    writer.writerow(row)
+                    sizes_f.write(json.dumps({
+                        "id": transition_id,
+                        "bytes": tree_size(transition_dir)
+                    }) + "\n")
+                    generated_count += 1
+                else:
+                    failed_count += 1
+
+                pbar.update(1)
+
+                # Save progress at most once per second (parent only):
+                # a wall-clock throttle keeps the checkpoint cost
+                # independent of how fast results stream in, where a
+                # per-count modulus would rewrite the file more often
+                # the faster the workers go
+                now = time.monotonic()
+                if now - last_progress_save >= 1.0:
+                    last_progress_save = now
+                    progress_data = {
+                        "generated": generated_count,
+                        "failed": failed_count,
+                        "total_attempted": generated_count + failed_count,
+                        "target": num_to_generate,
+                        "timestamp": time.time()
+                    }
+                    with open(progress_file, 'w') as f:
+                        json.dump(progress_data, f, indent=2)
+                    meta_fh.flush()
+
+    # The partial file already holds every row; promote it in place
     if metadata:
-        final_df = pd.DataFrame(metadata)
-        final_df.to_csv(os.path.join(output_dir, "metadata.csv"), index=False)
-    
+        os.replace(partial_path, os.path.join(output_dir, "metadata.csv"))
+    elif os.path.exists(partial_path):
+        os.remove(partial_path)
+
     print(f"✅ Generation complete!")
     print(f"   Generated: {generated_count}")
     print(f"   Failed: {failed_count}")
@@ -375,17 +720,33 @@ def generate_transitions(compatible_pairs, config):
     return metadata
 
 
+def tree_size(path, suffix='.wav'):
+    """Sum file sizes under a directory via os.scandir.
+
+    DirEntry.stat() reuses the metadata returned by the directory read,
+    so this avoids the extra stat(2) per file that os.walk +
+    os.path.getsize would issue.
+    """
+    total = 0
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    total += tree_size(entry.path, suffix)
+                elif entry.name.endswith(suffix):
+                    total += entry.stat(follow_symlinks=False).st_size
+    except OSError:
+        pass
+    return total
+
+
 def print_results_summary(config, metadata):
     """Print final results summary."""
     output_dir = config['data']['output_dir']
-    
+
     # Calculate total size
-    total_size = 0
-    for root, dirs, files in os.walk(output_dir):
-        for file in files:
-            if file.endswith('.wav'):
-                total_size += os.path.getsize(os.path.join(root, file))
-    
+    total_size = tree_size(output_dir)
+
     total_size_gb = total_size / (1024**3)
     
     print("\n" + "=" * 60)
@@ -13,6 +13,24 @@ import json
 from pathlib import Path
 from datetime import datetime, timedelta
 
+def tree_size(path, suffix='.wav'):
+    """Sum file sizes under a directory via os.scandir.
+
+    DirEntry.stat() reuses the metadata from the directory read, so the
+    5-second refresh doesn't issue a stat(2) per WAV file.
+    """
+    total = 0
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    total += tree_size(entry.path, suffix)
+                elif entry.name.endswith(suffix):
+                    total += entry.stat(follow_symlinks=False).st_size
+    except OSError:
+        pass
+    return total
+
 def monitor_local_progress(output_dir="./output/djnet_dataset_20k"):
     """Monitor local dataset generation progress."""
     print("🎵 DJNet Local Generation Monitor")
@@ -23,7 +41,15 @@ def monitor_local_progress(output_dir="./output/djnet_dataset_20k"):
     
     start_time = time.time()
     target_count = 20000  # Default target
-    
+
+    # Running size total, fed incrementally from the generator's
+    # append-only sizes.jsonl so each tick is O(new entries), not a
+    # re-walk of the whole output tree
+    sizes_file = os.path.join(output_dir, "sizes.jsonl")
+    sizes_offset = 0
+    total_size = 0
+    seen_size_ids = set()
+
     try:
         while True:
             if os.path.exists(output_dir):
@@ -60,16 +86,35 @@ def monitor_local_progress(output_dir="./output/djnet_dataset_20k"):
                     rate = 0
                     eta_hours = 0
                 
-                # Calculate dataset size
-                total_size = 0
-                try:
-                    for root, dirs, files in os.walk(output_dir):
-                        for file in files:
-                            if file.endswith('.wav'):
-                                total_size += os.path.getsize(os.path.join(root, file))
+                # Calculate dataset size: tail new entries from the
+                # generator's size log, falling back to a full scan only
+                # while the log doesn't exist yet
+                if os.path.exists(sizes_file):
+                    try:
+                        # Binary mode: text files disable tell() while
+                        # iterating, so advance the offset by raw line
+                        # length instead
+                        with open(sizes_file, 'rb') as f:
+                            f.seek(sizes_offset)
+                            for line in f:
+                                if not line.endswith(b'\n'):
+                                    # Partial write; re-read next tick
+                                    break
+                                sizes_offset += len(line)
+                                entry = json.loads(line)
+                                # The generator appends to the log, so a
+                                # resumed run re-logs transitions it
+                                # already wrote; count each id once
+                                entry_id = entry.get('id')
+                                if entry_id in seen_size_ids:
+                                    continue
+                                seen_size_ids.add(entry_id)
+                                total_size += entry.get('bytes', 0)
+                    except (OSError, ValueError):
+                        pass
                     size_gb = total_size / (1024**3)
-                except:
-                    size_gb = 0
+                else:
+                    size_gb = tree_size(output_dir) / (1024**3)
                 
                 # Clear screen and display info
                 os.system('clear' if os.name == 'posix' else 'cls')
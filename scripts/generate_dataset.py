@@ -7,6 +7,7 @@ This script generates the complete DJNet transition dataset from analyzed tracks
 
 import sys
 import yaml
+import json
 import os
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 
@@ -14,22 +15,35 @@ from src.dataset_generator import DatasetGenerator
 
 
 def load_config(config_path: str = "config/config.yaml") -> dict:
-    """Load configuration from YAML file."""
+    """Load configuration from YAML, via a JSON sidecar cache when fresh."""
+    cache_path = config_path + ".cache.json"
     try:
+        if (os.path.exists(cache_path) and
+                os.path.getmtime(cache_path) >= os.path.getmtime(config_path)):
+            with open(cache_path, 'r') as f:
+                return json.load(f)
         with open(config_path, 'r') as f:
-            return yaml.safe_load(f)
+            config = yaml.load(f, Loader=getattr(yaml, 'CSafeLoader', yaml.SafeLoader))
+        try:
+            # Pipeline subprocesses and later runs skip the YAML parse
+            with open(cache_path, 'w') as f:
+                json.dump(config, f)
+        except OSError:
+            pass
+        return config
     except FileNotFoundError:
         print(f"Config file not found: {config_path}")
         sys.exit(1)
 
 
-def main():
-    """Main function."""
+def main(config=None):
+    """Main function; accepts an already-loaded config from run_pipeline."""
     print("DJNet Dataset Generator")
     print("=" * 40)
     
-    # Load configuration
-    config = load_config()
+    # Load configuration unless the caller already did
+    if config is None:
+        config = load_config()
     
     # Check if analysis directory exists
     analysis_dir = config['data']['analysis_dir']
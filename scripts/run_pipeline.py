@@ -10,30 +10,49 @@ This script runs the complete DJNet dataset generation pipeline:
 
 import sys
 import yaml
+import json
 import os
-import subprocess
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from src.dataset_generator import DatasetGenerator
+# Stage mains run in this process: librosa/numpy import once for the
+# whole pipeline and the stages share the already-loaded config
+import download_data
+import analyze_tracks
+import generate_dataset
 
 
 def load_config(config_path: str = "config/config.yaml") -> dict:
-    """Load configuration from YAML file."""
+    """Load configuration from YAML, via a JSON sidecar cache when fresh."""
+    cache_path = config_path + ".cache.json"
     try:
+        if (os.path.exists(cache_path) and
+                os.path.getmtime(cache_path) >= os.path.getmtime(config_path)):
+            with open(cache_path, 'r') as f:
+                return json.load(f)
         with open(config_path, 'r') as f:
-            return yaml.safe_load(f)
+            config = yaml.load(f, Loader=getattr(yaml, 'CSafeLoader', yaml.SafeLoader))
+        try:
+            # Pipeline subprocesses and later runs skip the YAML parse
+            with open(cache_path, 'w') as f:
+                json.dump(config, f)
+        except OSError:
+            pass
+        return config
     except FileNotFoundError:
         print(f"Config file not found: {config_path}")
         sys.exit(1)
 
 
-def run_script(script_name: str) -> bool:
-    """Run a Python script and return success status."""
+def run_stage(stage_main, config: dict) -> bool:
+    """Call a stage's main() in-process and return success status."""
     try:
-        result = subprocess.run([sys.executable, script_name], check=True)
+        stage_main(config)
         return True
-    except subprocess.CalledProcessError as e:
-        print(f"Error running {script_name}: {e}")
+    except SystemExit as e:
+        return e.code in (0, None)
+    except Exception as e:
+        print(f"Error running stage: {e}")
         return False
 
 
@@ -49,8 +68,7 @@ def main():
     music_dir = config['data']['music_dir']
     if not os.path.exists(music_dir):
         print("Step 1: Downloading dataset...")
-        script_path = os.path.join(os.path.dirname(__file__), "download_data.py")
-        if not run_script(script_path):
+        if not run_stage(download_data.main, config):
             print("Failed to download data. Exiting.")
             sys.exit(1)
         print("✓ Data download complete")
@@ -65,8 +83,7 @@ def main():
     
     if not analysis_files:
         print("\nStep 2: Analyzing tracks...")
-        script_path = os.path.join(os.path.dirname(__file__), "analyze_tracks.py")
-        if not run_script(script_path):
+        if not run_stage(analyze_tracks.main, config):
             print("Failed to analyze tracks. Exiting.")
             sys.exit(1)
         print("✓ Track analysis complete")
@@ -75,8 +92,7 @@ def main():
     
     # Step 3: Generate dataset
     print("\nStep 3: Generating dataset...")
-    script_path = os.path.join(os.path.dirname(__file__), "generate_dataset.py")
-    if not run_script(script_path):
+    if not run_stage(generate_dataset.main, config):
         print("Failed to generate dataset. Exiting.")
         sys.exit(1)
     print("✓ Dataset generation complete")
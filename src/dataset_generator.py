@@ -7,11 +7,12 @@ combining audio analysis, track pairing, and transition generation.
 
 import os
 import json
-import random
 import pandas as pd
 import librosa
 import numpy as np
-from pydub import AudioSegment
+import soundfile as sf
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from functools import lru_cache
 from tqdm import tqdm
 from typing import Dict, List, Tuple, Optional
 
@@ -19,6 +20,85 @@ from .audio_analysis import AudioAnalyzer
 from .pairing import TrackPairer
 from .transitions import TransitionGenerator
 
+try:
+    from numba import njit
+except ImportError:  # numba unavailable; use the NumPy path
+    njit = None
+
+
+if njit is not None:
+    @njit(cache=True)
+    def compute_slice_window(downbeats, rate, stretched_len, sr,
+                             dur_sec, min_valid, u):
+        """Pick the source-A slice window as one compiled kernel.
+
+        Folds the downbeat scaling, validity mask, choice among the
+        last five valid starts (u is a uniform draw from the caller)
+        and second->sample conversion into a single pass with no
+        temporaries. Returns (-1, -1) when too few starts are valid.
+        """
+        limit = stretched_len / sr - dur_sec
+        count = 0
+        for t in downbeats:
+            if t * rate < limit:
+                count += 1
+        if count < min_valid:
+            return -1, -1
+        lo = count - 5 if count > 5 else 0
+        idx = lo + int(u * (count - lo))
+        if idx >= count:
+            idx = count - 1
+        seen = -1
+        start = 0.0
+        for t in downbeats:
+            if t * rate < limit:
+                seen += 1
+                if seen == idx:
+                    start = t * rate
+                    break
+        return int(start * sr), int((start + dur_sec) * sr)
+else:
+    compute_slice_window = None
+
+
+@lru_cache(maxsize=64)
+def _load_mono(path: str, sr: int):
+    """Decoded mono float32 audio, cached per (path, sample rate).
+
+    Popular tracks appear in many pairs; caching the decode cuts the
+    MP3 work from twice per pair to once per track per worker. FMA
+    tracks are ~30 s, so 64 entries stay in the low hundreds of MB.
+    """
+    y, _ = librosa.load(path, sr=sr, mono=True)
+    return y
+
+
+@lru_cache(maxsize=128)
+def _time_stretch(path: str, sr: int, rate: float):
+    """Time-stretched mono audio, memoized per (path, rate).
+
+    Target tempi repeat across pairs sharing a track, so rates recur
+    once rounded; each hit skips a full phase-vocoder STFT/iSTFT.
+    """
+    y = _load_mono(path, sr)
+    if rate == 1.0:
+        return y
+    return librosa.effects.time_stretch(y, rate=rate)
+
+
+def _generate_worker(job):
+    """Run one generate_transition call in a pool worker.
+
+    Module-level so it pickles by reference; the worker rebuilds its
+    generator from the config dict, which is cheap next to the audio
+    work itself.
+    """
+    config, pair, output_dir, transition_bars, transition_type = job
+    return DatasetGenerator(config).generate_transition(
+        pair, output_dir,
+        transition_bars=transition_bars,
+        transition_type=transition_type)
+
 
 class DatasetGenerator:
     """Main class for generating DJ transition datasets."""
@@ -41,6 +121,26 @@ class DatasetGenerator:
         self.transition_gen = TransitionGenerator(
             target_sr=config['audio']['target_sample_rate']
         )
+        # Per-type kwargs frozen once from config; only echo_fade also
+        # depends on the pair's tempo, added at lookup time
+        self._static_kwargs = {
+            'filter_sweep': {
+                'start_freq': config['filter_sweep']['start_freq'],
+                'end_freq': config['filter_sweep']['end_freq'],
+                'chunk_size_ms': config['filter_sweep']['chunk_size_ms']
+            },
+            'bass_swap_eq': {
+                'crossover_freq': config['eq']['crossover_freq']
+            },
+            'exp_fade': {
+                'power_out_range': config['exp_fade']['power_out_range'],
+                'power_in_range': config['exp_fade']['power_in_range']
+            }
+        }
+        self._echo_kwargs = {
+            'num_echos': config['echo_fade']['num_echos'],
+            'decay_db': config['echo_fade']['decay_db']
+        }
     
     def generate_transition(self, pair: Tuple[Dict, Dict], output_dir: str,
                           transition_bars: int = 8, transition_type: str = 'linear_fade') -> Optional[str]:
@@ -71,39 +171,49 @@ class DatasetGenerator:
             transition_beats = transition_bars * beats_per_bar
             transition_duration_sec = transition_beats / (target_tempo / 60.0)
             
-            # Load and time-stretch audio
-            y_a, _ = librosa.load(track_a_data['path'], sr=self.analyzer.target_sr, mono=True)
-            y_b, _ = librosa.load(track_b_data['path'], sr=self.analyzer.target_sr, mono=True)
-            
-            rate_a = target_tempo / track_a_data['tempo']
-            rate_b = target_tempo / track_b_data['tempo']
-            
-            y_a_warped = librosa.effects.time_stretch(y_a, rate=rate_a)
-            y_b_warped = librosa.effects.time_stretch(y_b, rate=rate_b)
+            # Load and time-stretch audio, both memoized; rates are
+            # rounded so repeated (track, tempo) combinations hit cache
+            rate_a = round(target_tempo / track_a_data['tempo'], 4)
+            rate_b = round(target_tempo / track_b_data['tempo'], 4)
+
+            y_a_warped = _time_stretch(track_a_data['path'], self.analyzer.target_sr, rate_a)
+            y_b_warped = _time_stretch(track_b_data['path'], self.analyzer.target_sr, rate_b)
             
             # Find slice points
-            downbeats_a = np.array(track_a_data['downbeat_times']) * rate_a
-            end_time_a_warped = len(y_a_warped) / self.analyzer.target_sr
-            
-            valid_starts_a = downbeats_a[downbeats_a < end_time_a_warped - transition_duration_sec]
-            if len(valid_starts_a) < self.config['dataset']['minimum_valid_starts']:
-                return None
-            
-            start_a_sec = np.random.choice(valid_starts_a[-5:])
-            end_a_sec = start_a_sec + transition_duration_sec
-            
-            downbeats_b = np.array(track_b_data['downbeat_times']) * rate_b
+            sr = self.analyzer.target_sr
+            min_valid = self.config['dataset']['minimum_valid_starts']
+            downbeats_a = np.ascontiguousarray(track_a_data['downbeat_times'],
+                                               dtype=np.float64)
+
+            if compute_slice_window is not None:
+                start_idx_a, end_idx_a = compute_slice_window(
+                    downbeats_a, rate_a, len(y_a_warped), sr,
+                    transition_duration_sec, min_valid, np.random.random())
+                if start_idx_a < 0:
+                    return None
+            else:
+                scaled_a = downbeats_a * rate_a
+                end_time_a_warped = len(y_a_warped) / sr
+
+                valid_starts_a = scaled_a[scaled_a < end_time_a_warped - transition_duration_sec]
+                if len(valid_starts_a) < min_valid:
+                    return None
+
+                start_a_sec = np.random.choice(valid_starts_a[-5:])
+                start_idx_a = int(start_a_sec * sr)
+                end_idx_a = int((start_a_sec + transition_duration_sec) * sr)
+
+            downbeats_b = track_b_data['downbeat_times']
             if len(downbeats_b) == 0:
                 return None
-            
-            start_b_sec = downbeats_b[0]  # Start from the first downbeat
-            end_b_sec = start_b_sec + transition_duration_sec
-            
+
+            start_b_sec = downbeats_b[0] * rate_b  # Start from the first downbeat
+            start_idx_b = int(start_b_sec * sr)
+            end_idx_b = int((start_b_sec + transition_duration_sec) * sr)
+
             # Slice the audio
-            slice_a_float = y_a_warped[int(start_a_sec * self.analyzer.target_sr):
-                                     int(end_a_sec * self.analyzer.target_sr)]
-            slice_b_float = y_b_warped[int(start_b_sec * self.analyzer.target_sr):
-                                     int(end_b_sec * self.analyzer.target_sr)]
+            slice_a_float = y_a_warped[start_idx_a:end_idx_a]
+            slice_b_float = y_b_warped[start_idx_b:end_idx_b]
             
             if len(slice_a_float) == 0 or len(slice_b_float) == 0:
                 return None
@@ -116,33 +226,29 @@ class DatasetGenerator:
             # Convert to 16-bit integer format
             slice_a_int = self.transition_gen.float_to_int16(slice_a_float)
             slice_b_int = self.transition_gen.float_to_int16(slice_b_float)
-            
-            # Create AudioSegment objects
-            seg_a = AudioSegment(
-                slice_a_int.tobytes(), 
-                frame_rate=self.analyzer.target_sr, 
-                sample_width=2, 
-                channels=1
-            )
-            seg_b = AudioSegment(
-                slice_b_int.tobytes(), 
-                frame_rate=self.analyzer.target_sr, 
-                sample_width=2, 
-                channels=1
-            )
-            
-            # Generate transition based on type
+
+            # Generate transition. Every type now has an array fast
+            # path, so the audio is decoded once and stays a NumPy
+            # buffer end to end -- no AudioSegment byte round trips
             transition_kwargs = self._get_transition_kwargs(transition_type, target_tempo)
-            target_transition = self.transition_gen.create_transition(
-                seg_a, seg_b, transition_type, **transition_kwargs
+            target_int = self.transition_gen.create_transition(
+                slice_a_int, slice_b_int, transition_type, **transition_kwargs
             )
-            
-            # Save files
-            os.makedirs(output_dir, exist_ok=True)
-            seg_a.export(os.path.join(output_dir, "source_a.wav"), format="wav")
-            seg_b.export(os.path.join(output_dir, "source_b.wav"), format="wav")
-            target_transition.export(os.path.join(output_dir, "target.wav"), format="wav")
-            
+
+            # Save files: write the arrays we already hold directly via
+            # libsndfile instead of round-tripping through pydub export.
+            # Everything goes into a staging directory first; the single
+            # os.replace below publishes the transition atomically, so a
+            # killed run never leaves a half-written output directory
+            staging_dir = output_dir + ".tmp"
+            os.makedirs(staging_dir, exist_ok=True)
+            sf.write(os.path.join(staging_dir, "source_a.wav"), slice_a_float,
+                     self.analyzer.target_sr, subtype='PCM_16')
+            sf.write(os.path.join(staging_dir, "source_b.wav"), slice_b_float,
+                     self.analyzer.target_sr, subtype='PCM_16')
+            sf.write(os.path.join(staging_dir, "target.wav"), target_int,
+                     self.analyzer.target_sr, subtype='PCM_16')
+
             # Generate conditioning info
             conditioning = {
                 "source_a_path": track_a_data['path'],
@@ -152,10 +258,12 @@ class DatasetGenerator:
                 "transition_type": transition_type,
                 "transition_bars": transition_bars
             }
-            
-            with open(os.path.join(output_dir, "conditioning.json"), 'w') as f:
+
+            with open(os.path.join(staging_dir, "conditioning.json"), 'w') as f:
                 json.dump(conditioning, f, indent=2)
-            
+
+            os.replace(staging_dir, output_dir)
+
             return output_dir
             
         except Exception as e:
@@ -173,88 +281,127 @@ class DatasetGenerator:
         Returns:
             Dictionary of keyword arguments
         """
-        kwargs = {}
-        
         if transition_type == 'echo_fade':
-            beat_dur_ms = 60000 / target_tempo
-            kwargs.update({
-                'beat_duration_ms': int(beat_dur_ms),
-                'num_echos': self.config['echo_fade']['num_echos'],
-                'decay_db': self.config['echo_fade']['decay_db']
-            })
-        elif transition_type == 'filter_sweep':
-            kwargs.update({
-                'start_freq': self.config['filter_sweep']['start_freq'],
-                'end_freq': self.config['filter_sweep']['end_freq'],
-                'chunk_size_ms': self.config['filter_sweep']['chunk_size_ms']
-            })
-        elif transition_type == 'bass_swap_eq':
-            kwargs.update({
-                'crossover_freq': self.config['eq']['crossover_freq']
-            })
-        elif transition_type == 'exp_fade':
-            kwargs.update({
-                'power_out_range': self.config['exp_fade']['power_out_range'],
-                'power_in_range': self.config['exp_fade']['power_in_range']
-            })
-        
-        return kwargs
+            kwargs = dict(self._echo_kwargs)
+            kwargs['beat_duration_ms'] = int(60000 / target_tempo)
+            return kwargs
+
+        return self._static_kwargs.get(transition_type, {})
     
-    def generate_dataset(self, compatible_pairs: List[Tuple[Dict, Dict]]) -> List[Dict]:
+    def generate_dataset(self, compatible_pairs) -> List[Dict]:
         """
         Generate the complete dataset from compatible pairs.
-        
+
         Args:
-            compatible_pairs: List of compatible track pairs
-            
+            compatible_pairs: Iterable of compatible track pairs; a lazy
+                generator from TrackPairer.iter_compatible_pairs works
+                as well as a materialized list
+
         Returns:
             List of metadata dictionaries for generated transitions
         """
-        # Shuffle pairs for diversity
+        # One rng serves the sampling and every type draw; sampling all
+        # transition types up front replaces a random.choices call (and
+        # its cumulative-weight rebuild) per iteration
+        rng = np.random.default_rng()
+
+        num_transitions = self.config['dataset']['num_transitions']
+
+        # Reservoir-sample a bounded working set from the pair stream:
+        # 4x the target leaves headroom for failed pairs while keeping
+        # memory O(num_transitions) even when the full compatibility
+        # matrix would hold millions of pairs
+        capacity = max(num_transitions * 4, 1)
+        reservoir = []
+        for seen, pair in enumerate(compatible_pairs):
+            if len(reservoir) < capacity:
+                reservoir.append(pair)
+            else:
+                slot = rng.integers(0, seen + 1)
+                if slot < capacity:
+                    reservoir[slot] = pair
+        compatible_pairs = reservoir
+
+        # Shuffle pairs for diversity (the reservoir keeps a uniform
+        # sample, but early stream positions still fill the first slots)
         if self.config['dataset']['shuffle_pairs']:
-            random.shuffle(compatible_pairs)
-        
+            compatible_pairs = [compatible_pairs[i]
+                                for i in rng.permutation(len(compatible_pairs))]
+
         # Setup transition types and weights
         transition_types = [t['name'] for t in self.config['transitions']['types']]
-        transition_weights = [t['weight'] for t in self.config['transitions']['types']]
+        transition_weights = np.array(
+            [t['weight'] for t in self.config['transitions']['types']],
+            dtype=np.float64)
+        type_idx = rng.choice(len(transition_types),
+                              size=len(compatible_pairs),
+                              p=transition_weights / transition_weights.sum())
         
-        # Generate transitions
+        # Generate transitions. Each pair is an independent job, so keep
+        # a process pool saturated and draw replacement pairs as results
+        # come back until the target count is reached. IDs are assigned
+        # per attempt, so failed pairs leave gaps in the numbering.
         metadata = []
         generated_count = 0
+        next_id = 0
         pair_iterator = iter(compatible_pairs)
-        
-        num_transitions = self.config['dataset']['num_transitions']
+
+        transition_bars = self.config['transitions']['transition_bars']
         dataset_root = self.config['data']['output_dir']
         os.makedirs(dataset_root, exist_ok=True)
-        
-        with tqdm(total=num_transitions, desc="Generating Transitions") as pbar:
-            while generated_count < num_transitions:
+
+        futures = {}
+
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor, \
+                tqdm(total=num_transitions, desc="Generating Transitions") as pbar:
+
+            def submit_next() -> bool:
+                nonlocal next_id
                 try:
                     pair = next(pair_iterator)
                 except StopIteration:
-                    print("Ran out of compatible pairs.")
-                    break
-                
-                # Choose transition type randomly based on weights
-                chosen_type = random.choices(transition_types, weights=transition_weights, k=1)[0]
-                
-                transition_id = f"transition_{generated_count:05d}"
+                    return False
+
+                # Transition type was pre-sampled for this attempt
+                chosen_type = transition_types[type_idx[next_id]]
+
+                transition_id = f"transition_{next_id:05d}"
+                next_id += 1
                 output_dir = os.path.join(dataset_root, transition_id)
-                
-                result_path = self.generate_transition(
-                    pair, output_dir, 
-                    transition_bars=self.config['transitions']['transition_bars'],
-                    transition_type=chosen_type
-                )
-                
-                if result_path:
-                    metadata.append({
-                        "id": transition_id,
-                        "path": result_path,
-                        "transition_type": chosen_type
-                    })
-                    generated_count += 1
-                    pbar.update(1)
+
+                job = (self.config, pair, output_dir, transition_bars, chosen_type)
+                futures[executor.submit(_generate_worker, job)] = (transition_id, chosen_type)
+                return True
+
+            # Two jobs in flight per worker hides result-collection time
+            for _ in range(min(num_transitions, 2 * (os.cpu_count() or 1))):
+                if not submit_next():
+                    break
+
+            while futures and generated_count < num_transitions:
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                for future in done:
+                    transition_id, chosen_type = futures.pop(future)
+                    result_path = future.result()
+
+                    if result_path:
+                        metadata.append({
+                            "id": transition_id,
+                            "path": result_path,
+                            "transition_type": chosen_type
+                        })
+                        generated_count += 1
+                        pbar.update(1)
+
+                    if generated_count + len(futures) < num_transitions:
+                        submit_next()
+
+            if generated_count < num_transitions and not futures:
+                print("Ran out of compatible pairs.")
+
+            # Target reached: drop any jobs that haven't started yet
+            for future in futures:
+                future.cancel()
         
         # Save master metadata file
         metadata_df = pd.DataFrame(metadata)
@@ -286,11 +433,11 @@ class DatasetGenerator:
         print("Step 2: Loading analysis data...")
         tracks_data = self.analyzer.load_analysis_data(analysis_files)
         
-        # Step 3: Find compatible pairs
+        # Step 3: Find compatible pairs, lazily; generate_dataset keeps
+        # only a bounded sample instead of the full pair list
         print("Step 3: Finding compatible track pairs...")
-        compatible_pairs = self.pairer.find_compatible_pairs(tracks_data)
-        print(f"Found {len(compatible_pairs)} compatible pairs.")
-        
+        compatible_pairs = self.pairer.iter_compatible_pairs(tracks_data)
+
         # Step 4: Generate dataset
         print("Step 4: Generating transition dataset...")
         metadata = self.generate_dataset(compatible_pairs)
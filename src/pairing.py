@@ -5,62 +5,187 @@ This module provides functionality to find compatible pairs of tracks
 based on tempo and key compatibility for creating smooth transitions.
 """
 
-from typing import List, Dict, Tuple
-import random
+from typing import Dict, Iterator, List, Tuple
+
+import numpy as np
+
+try:
+    from .pairing_jit import compatible_pairs_mask
+except ImportError:  # numba unavailable; fall back to NumPy broadcasting
+    compatible_pairs_mask = None
+
+# Structure-of-arrays layout for track catalogs: contiguous tempo/key
+# columns scan at SIMD width instead of chasing per-dict pointers
+TRACK_DT = np.dtype([('tempo', 'f4'), ('key', 'i1'), ('path', 'O')])
+
+
+def tracks_to_record_array(tracks_data: List[Dict]) -> np.ndarray:
+    """
+    Pack a list of track analysis dicts into a structured NumPy array.
+
+    Missing tempos become NaN so the numeric columns stay dense; NaN
+    fails every threshold comparison, which keeps those tracks out of
+    any vectorized selection.
+
+    Args:
+        tracks_data: List of track analysis data dictionaries
+
+    Returns:
+        Record array with 'tempo', 'key', and 'path' fields
+    """
+    return np.fromiter(
+        ((t['tempo'] if t['tempo'] is not None else np.nan, t['key'], t['path'])
+         for t in tracks_data),
+        dtype=TRACK_DT, count=len(tracks_data))
+
+
+def pairs_to_dicts(indices: np.ndarray,
+                   tracks_data: List[Dict]) -> List[Tuple[Dict, Dict]]:
+    """
+    Materialize an index-pair array back into dict tuples.
+
+    Args:
+        indices: (k, 2) array of indices into tracks_data
+        tracks_data: List of track analysis data dictionaries
+
+    Returns:
+        List of compatible track pairs (tuples)
+    """
+    return [(tracks_data[i], tracks_data[j]) for i, j in indices]
 
 
 class TrackPairer:
     """Finds compatible pairs of tracks for DJ transitions."""
     
-    def __init__(self, tempo_threshold: float = 10.0, key_threshold: int = 1):
+    def __init__(self, tempo_threshold: float = 10.0, key_threshold: int = 1,
+                 min_duration: float = None):
         """
         Initialize the TrackPairer.
         
         Args:
             tempo_threshold: Maximum BPM difference for compatibility
             key_threshold: Maximum key difference for compatibility
+            min_duration: Minimum track length in seconds; shorter tracks
+                are dropped before pairing so they are never loaded and
+                then rejected at generation time
         """
         self.tempo_threshold = tempo_threshold
         self.key_threshold = key_threshold
+        self.min_duration = min_duration
+
+        # 12 x 12 key-compatibility LUT: the per-pair mod/min circular
+        # distance chain collapses to a single boolean gather
+        pitch_classes = np.arange(12)
+        key_dist = np.abs(pitch_classes[:, None] - pitch_classes[None, :])
+        self._key_compat = np.minimum(key_dist, 12 - key_dist) <= key_threshold
     
-    def find_compatible_pairs(self, tracks_data: List[Dict]) -> List[Tuple[Dict, Dict]]:
+    def _iter_compatible_index_pairs(self, tracks_data: List[Dict]) -> Iterator[Tuple[int, int]]:
+        """
+        Yield (i, j) index pairs into tracks_data for compatible tracks.
+
+        Indices are the pairer's native currency: two int32s per pair
+        instead of a tuple holding two dict references, which keeps the
+        memory cost of dense pair sets at bytes rather than objects.
+
+        Args:
+            tracks_data: List of track analysis data dictionaries
+
+        Yields:
+            Ordered (index_a, index_b) pairs into tracks_data
+        """
+        # Skip tracks with missing tempo data
+        valid_idx = [i for i, t in enumerate(tracks_data)
+                     if t['tempo'] is not None]
+        if self.min_duration is not None:
+            # Tracks that are too short for a source segment can never
+            # yield a transition; drop them before the O(N^2) matching
+            valid_idx = [i for i in valid_idx
+                         if tracks_data[i].get('duration') is None
+                         or tracks_data[i]['duration'] >= self.min_duration]
+        if not valid_idx:
+            return
+
+        tracks = tracks_to_record_array([tracks_data[i] for i in valid_idx])
+        tempos = tracks['tempo']
+        keys = tracks['key']
+        valid_idx = np.asarray(valid_idx, dtype=np.int32)
+
+        if compatible_pairs_mask is not None:
+            # JIT-compiled kernel: parallel native loop over all pairs
+            compatible = compatible_pairs_mask(
+                tempos, keys, self.tempo_threshold, self.key_threshold)
+            for i, j in np.argwhere(compatible):
+                yield (int(valid_idx[i]), int(valid_idx[j]))
+            return
+
+        # NumPy fallback: sort by tempo and sweep a sliding window. Rule 1
+        # bounds each track's partners to the tracks within tempo_threshold
+        # of it, so after the O(n log n) sort each row only checks its
+        # O(window) tempo neighbours instead of all n columns. As in the
+        # kernel path, each unordered pair is tested once (j > i in sorted
+        # order) and emitted in both orderings
+        order = np.argsort(tempos, kind='stable')
+        tempos_sorted = tempos[order]
+        keys_sorted = keys[order]
+
+        # window_end[i] is one past the last j with
+        # tempos_sorted[j] - tempos_sorted[i] <= tempo_threshold
+        window_end = np.searchsorted(
+            tempos_sorted, tempos_sorted + np.float32(self.tempo_threshold),
+            side='right')
+
+        for i in range(len(order) - 1):
+            hi = window_end[i]
+            if hi <= i + 1:
+                continue
+
+            # Rule 2: Key compatibility via the LUT, gathered over the
+            # tempo window
+            key_ok = self._key_compat[keys_sorted[i], keys_sorted[i + 1:hi]]
+
+            for j in np.flatnonzero(key_ok) + i + 1:
+                index_a = int(valid_idx[order[i]])
+                index_b = int(valid_idx[order[j]])
+                yield (index_a, index_b)
+                yield (index_b, index_a)
+
+    def iter_compatible_pairs(self, tracks_data: List[Dict]) -> Iterator[Tuple[Dict, Dict]]:
+        """
+        Yield pairs of tracks with compatible tempo and key, lazily.
+
+        Pairs are produced as the vectorized match advances, so a
+        consumer that only needs the first num_transitions pairs never
+        holds the full O(N^2) pair list in memory.
+
+        Args:
+            tracks_data: List of track analysis data dictionaries
+
+        Yields:
+            Compatible track pairs (tuples)
+        """
+        for i, j in self._iter_compatible_index_pairs(tracks_data):
+            yield (tracks_data[i], tracks_data[j])
+
+    def find_compatible_pairs(self, tracks_data: List[Dict],
+                              return_indices: bool = False):
         """
         Find pairs of tracks with compatible tempo and key.
-        
+
         Args:
             tracks_data: List of track analysis data dictionaries
-            
+            return_indices: Return a (k, 2) int32 array of indices into
+                tracks_data instead of materializing dict tuples; at
+                8 bytes per pair this is roughly 10x lighter for dense
+                pair sets
+
         Returns:
-            List of compatible track pairs (tuples)
+            List of compatible track pairs (tuples), or the index array
+            when return_indices is set
         """
-        pairs = []
-        
-        for i in range(len(tracks_data)):
-            for j in range(len(tracks_data)):
-                if i == j:  # Don't pair a song with itself
-                    continue
-                
-                track_a = tracks_data[i]
-                track_b = tracks_data[j]
-                
-                # Skip if tempo data is missing
-                if track_a['tempo'] is None or track_b['tempo'] is None:
-                    continue
-                
-                # Rule 1: Tempo compatibility
-                tempo_diff = abs(track_a['tempo'] - track_b['tempo'])
-                if tempo_diff > self.tempo_threshold:
-                    continue
-                
-                # Rule 2: Key compatibility
-                key_diff = abs(track_a['key'] - track_b['key'])
-                # Keys are 0-11. Compatible if diff is 0, 1, or 11 (wrap-around)
-                if key_diff > self.key_threshold and key_diff < (12 - self.key_threshold):
-                    continue
-                
-                pairs.append((track_a, track_b))
-        
-        return pairs
+        if return_indices:
+            indices = list(self._iter_compatible_index_pairs(tracks_data))
+            return np.array(indices, dtype=np.int32).reshape(-1, 2)
+        return list(self.iter_compatible_pairs(tracks_data))
     
     def filter_by_tempo_range(self, tracks_data: List[Dict], 
                              min_tempo: float = 60.0, 
@@ -76,13 +201,14 @@ class TrackPairer:
         Returns:
             Filtered list of tracks within tempo range
         """
-        filtered_tracks = []
-        for track in tracks_data:
-            if (track['tempo'] is not None and 
-                min_tempo <= track['tempo'] <= max_tempo):
-                filtered_tracks.append(track)
-        
-        return filtered_tracks
+        if not tracks_data:
+            return []
+
+        # One comparison pass over the contiguous tempo column; NaN
+        # (missing tempo) fails both bounds and drops out
+        tempos = tracks_to_record_array(tracks_data)['tempo']
+        mask = (tempos >= min_tempo) & (tempos <= max_tempo)
+        return [tracks_data[i] for i in np.flatnonzero(mask)]
     
     def group_by_key(self, tracks_data: List[Dict]) -> Dict[int, List[Dict]]:
         """
@@ -94,14 +220,14 @@ class TrackPairer:
         Returns:
             Dictionary mapping keys to lists of tracks
         """
-        key_groups = {}
+        # Keys are bounded pitch classes, so 12 preallocated buckets and
+        # one append per track replace the hash-probe-and-branch dict
+        # build
+        groups = [[] for _ in range(12)]
         for track in tracks_data:
-            key = track['key']
-            if key not in key_groups:
-                key_groups[key] = []
-            key_groups[key].append(track)
-        
-        return key_groups
+            groups[track['key']].append(track)
+
+        return {key: group for key, group in enumerate(groups) if group}
     
     def group_by_tempo(self, tracks_data: List[Dict], 
                       tempo_bins: int = 10) -> Dict[int, List[Dict]]:
@@ -115,45 +241,56 @@ class TrackPairer:
         Returns:
             Dictionary mapping tempo bin indices to lists of tracks
         """
-        # Find tempo range
-        valid_tempos = [t['tempo'] for t in tracks_data if t['tempo'] is not None]
-        if not valid_tempos:
+        if not tracks_data:
             return {}
-        
-        min_tempo = min(valid_tempos)
-        max_tempo = max(valid_tempos)
+
+        # Bin indices come from one vectorized pass over the tempo
+        # column; only the group-dict fill stays in Python
+        tempos = tracks_to_record_array(tracks_data)['tempo']
+        valid = ~np.isnan(tempos)
+        if not valid.any():
+            return {}
+
+        valid_idx = np.flatnonzero(valid)
+        valid_tempos = tempos[valid_idx]
+        min_tempo = np.min(valid_tempos)
+        max_tempo = np.max(valid_tempos)
         bin_size = (max_tempo - min_tempo) / tempo_bins
-        
-        tempo_groups = {}
-        for track in tracks_data:
-            if track['tempo'] is not None:
-                bin_idx = int((track['tempo'] - min_tempo) / bin_size)
-                bin_idx = min(bin_idx, tempo_bins - 1)  # Handle edge case
-                
-                if bin_idx not in tempo_groups:
-                    tempo_groups[bin_idx] = []
-                tempo_groups[bin_idx].append(track)
-        
-        return tempo_groups
+        if bin_size == 0:  # All tempos equal: one bin
+            bin_size = 1.0
+
+        bin_indices = ((valid_tempos - min_tempo) / bin_size).astype(np.int64)
+        np.clip(bin_indices, 0, tempo_bins - 1, out=bin_indices)  # Handle edge case
+
+        # Sort-and-split grouping: one stable argsort clusters each bin's
+        # tracks contiguously and searchsorted finds the bin boundaries,
+        # replacing the per-track dict lookup/append loop
+        order = np.argsort(bin_indices, kind='stable')
+        sorted_bins = bin_indices[order]
+        splits = np.searchsorted(sorted_bins, np.arange(tempo_bins + 1))
+
+        return {b: [tracks_data[valid_idx[i]] for i in order[splits[b]:splits[b + 1]]]
+                for b in range(tempo_bins) if splits[b] != splits[b + 1]}
     
-    def shuffle_pairs(self, pairs: List[Tuple[Dict, Dict]], 
-                     seed: int = None) -> List[Tuple[Dict, Dict]]:
+    def shuffle_pairs(self, pairs, seed: int = None):
         """
-        Shuffle the list of pairs for diversity.
-        
+        Shuffle the pairs for diversity.
+
+        One PCG64 permutation replaces the per-element Python
+        Fisher-Yates; index arrays are reordered with a single fancy
+        index in C.
+
         Args:
-            pairs: List of track pairs
+            pairs: List of track pairs, or a (k, 2) index array
             seed: Random seed for reproducibility
-            
+
         Returns:
-            Shuffled list of pairs
+            Shuffled pairs (same container type as the input)
         """
-        if seed is not None:
-            random.seed(seed)
-        
-        shuffled_pairs = pairs.copy()
-        random.shuffle(shuffled_pairs)
-        return shuffled_pairs
+        perm = np.random.default_rng(seed).permutation(len(pairs))
+        if isinstance(pairs, np.ndarray):
+            return pairs[perm]
+        return [pairs[i] for i in perm]
     
     def get_pairing_stats(self, pairs: List[Tuple[Dict, Dict]]) -> Dict:
         """
@@ -167,25 +304,32 @@ class TrackPairer:
         """
         if not pairs:
             return {"total_pairs": 0}
-        
-        tempo_diffs = []
-        key_diffs = []
-        
-        for track_a, track_b in pairs:
-            tempo_diffs.append(abs(track_a['tempo'] - track_b['tempo']))
-            key_diff = abs(track_a['key'] - track_b['key'])
-            # Handle wrap-around for keys
-            key_diff = min(key_diff, 12 - key_diff)
-            key_diffs.append(key_diff)
-        
+
+        # Gather the numeric columns once, then each statistic is a
+        # single C-level reduction instead of a Python loop per pair
+        k = len(pairs)
+        tempos_a = np.fromiter((a['tempo'] for a, _ in pairs),
+                               dtype=np.float64, count=k)
+        tempos_b = np.fromiter((b['tempo'] for _, b in pairs),
+                               dtype=np.float64, count=k)
+        keys_a = np.fromiter((a['key'] for a, _ in pairs),
+                             dtype=np.int16, count=k)
+        keys_b = np.fromiter((b['key'] for _, b in pairs),
+                             dtype=np.int16, count=k)
+
+        tempo_diffs = np.abs(tempos_a - tempos_b)
+        # Handle wrap-around for keys
+        key_raw = np.abs(keys_a - keys_b)
+        key_diffs = np.minimum(key_raw, 12 - key_raw)
+
         stats = {
-            "total_pairs": len(pairs),
-            "avg_tempo_diff": sum(tempo_diffs) / len(tempo_diffs),
-            "max_tempo_diff": max(tempo_diffs),
-            "min_tempo_diff": min(tempo_diffs),
-            "avg_key_diff": sum(key_diffs) / len(key_diffs),
-            "max_key_diff": max(key_diffs),
-            "min_key_diff": min(key_diffs)
+            "total_pairs": k,
+            "avg_tempo_diff": float(tempo_diffs.mean()),
+            "max_tempo_diff": float(tempo_diffs.max()),
+            "min_tempo_diff": float(tempo_diffs.min()),
+            "avg_key_diff": float(key_diffs.mean()),
+            "max_key_diff": int(key_diffs.max()),
+            "min_key_diff": int(key_diffs.min())
         }
-        
+
         return stats
@@ -8,10 +8,88 @@ smooth DJ-style transitions between tracks.
 import librosa
 import numpy as np
 import random
+from functools import lru_cache
+from scipy import signal
 from pydub import AudioSegment
 from pydub.effects import low_pass_filter, high_pass_filter
 from typing import Dict, Tuple, Optional
 
+try:
+    from .transitions_jit import crossfade_int16
+except ImportError:  # numba unavailable; fall back to NumPy ramps
+    crossfade_int16 = None
+
+
+@lru_cache(maxsize=64)
+def _make_gain_curve(n: int, curve_type: str, power: float) -> np.ndarray:
+    """
+    Build (and memoize) a fade gain curve of n samples.
+
+    Fades of the same length and power recur constantly within a run
+    (both halves of a crossfade, every linear fade of a given duration),
+    so the linspace + power work is paid once per distinct shape. The
+    returned array is marked read-only because it is shared.
+
+    Args:
+        n: Number of samples in the curve
+        curve_type: 'in' for fade in, 'out' for fade out
+        power: Power curve exponent
+
+    Returns:
+        Read-only float32 gain curve
+    """
+    gain_curve = np.linspace(0.0, 1.0, n, dtype=np.float32)
+
+    if curve_type == 'in':
+        gain_curve = gain_curve ** np.float32(power)
+    elif curve_type == 'out':
+        gain_curve = 1.0 - (gain_curve ** np.float32(power))
+
+    gain_curve.flags.writeable = False
+    return gain_curve
+
+
+@lru_cache(maxsize=1024)
+def _butter_sos(order: int, cutoff: float, sr: int, btype: str) -> np.ndarray:
+    """
+    Memoized Butterworth second-order sections.
+
+    The crossover and sweep cutoffs repeat across every transition of a
+    run at a fixed sample rate, so each distinct filter design is paid
+    once.
+
+    Args:
+        order: Filter order
+        cutoff: Cutoff frequency in Hz
+        sr: Sample rate in Hz
+        btype: 'low' or 'high'
+
+    Returns:
+        SOS coefficient array for scipy.signal.sosfilt
+    """
+    return signal.butter(order, cutoff / (sr / 2), btype, output='sos')
+
+
+@lru_cache(maxsize=64)
+def _make_gain_curve_q15(n: int, curve_type: str, power: float) -> np.ndarray:
+    """
+    Q15 fixed-point version of _make_gain_curve.
+
+    Gains in [0, 1] map to int16 0..32767, letting fades run entirely in
+    the integer domain: sample * gain fits int32 and >> 15 rescales.
+
+    Args:
+        n: Number of samples in the curve
+        curve_type: 'in' for fade in, 'out' for fade out
+        power: Power curve exponent
+
+    Returns:
+        Read-only int16 Q15 gain curve
+    """
+    gain_q15 = (_make_gain_curve(n, curve_type, power) * 32767.0).astype(np.int16)
+    gain_q15.flags.writeable = False
+    return gain_q15
+
 
 class TransitionGenerator:
     """Generates various types of audio transitions between tracks."""
@@ -38,21 +116,20 @@ class TransitionGenerator:
         Returns:
             Faded audio segment
         """
-        gain_curve = np.linspace(0.0, 1.0, len(segment))
-        
-        if curve_type == 'in':
-            gain_curve = gain_curve ** power
-        elif curve_type == 'out':
-            gain_curve = 1.0 - (gain_curve ** power)
-        
-        samples = np.array(segment.get_array_of_samples()).astype(np.float32)
-        
+        # Zero-copy int16 view of the raw buffer, then a Q15 integer
+        # fade: sample * gain fits int32 and >> 15 rescales, so the
+        # whole pass stays in the integer domain with no float
+        # round trip
+        samples = np.frombuffer(segment.raw_data, dtype=np.int16)
+        frames = len(samples) // segment.channels
+        gain_q15 = _make_gain_curve_q15(frames, curve_type, round(power, 3))
+
         if segment.channels == 2:
-            gain_matrix = np.array([gain_curve, gain_curve]).T
-            faded_samples = (samples.reshape(-1, 2) * gain_matrix).astype(np.int16)
+            faded_samples = ((samples.astype(np.int32).reshape(-1, 2)
+                              * gain_q15[:, None]) >> 15).astype(np.int16)
         else:
-            faded_samples = (samples * gain_curve).astype(np.int16)
-        
+            faded_samples = ((samples.astype(np.int32) * gain_q15) >> 15).astype(np.int16)
+
         return segment._spawn(faded_samples.tobytes())
     
     def eq_bass_swap_transition(self, seg_a: AudioSegment, seg_b: AudioSegment, 
@@ -68,36 +145,15 @@ class TransitionGenerator:
         Returns:
             Mixed audio segment with bass swap transition
         """
-        # Split into low and high frequency components
-        lows_a = seg_a.low_pass_filter(crossover_freq)
-        highs_a = seg_a.high_pass_filter(crossover_freq)
-        lows_b = seg_b.low_pass_filter(crossover_freq)
-        highs_b = seg_b.high_pass_filter(crossover_freq)
-        
-        fade_duration = len(seg_a)
-        halfway_point = fade_duration // 2
-        
-        # Fade out the highs of Song A
-        highs_a_faded = highs_a.fade_out(fade_duration)
-        # Fade in the highs of Song B
-        highs_b_faded = highs_b.fade_in(fade_duration)
-        
-        # Bass A plays for the first half, then fades out
-        bass_a_swap = lows_a[:halfway_point].append(
-            AudioSegment.silent(duration=fade_duration - halfway_point), 
-            crossfade=10
-        )
-        # Silence for the first half, then Bass B fades in
-        bass_b_swap = AudioSegment.silent(duration=halfway_point).append(
-            lows_b[halfway_point:], crossfade=10
-        )
-        
-        # Combine all layers
-        final_mix = (highs_a_faded.overlay(bass_a_swap)
-                    .overlay(bass_b_swap)
-                    .overlay(highs_b_faded))
-        
-        return final_mix
+        # Decode once and run the SciPy SOS implementation: one cached
+        # Butterworth per source with the highs as its exact complement,
+        # instead of four pydub single-pole filter passes plus four
+        # full-buffer overlays
+        a = np.frombuffer(seg_a.raw_data, dtype=np.int16)
+        b = np.frombuffer(seg_b.raw_data, dtype=np.int16)
+
+        mixed = self._bass_swap_array(a, b, crossover_freq=crossover_freq)
+        return seg_a._spawn(mixed.tobytes())
     
     def low_pass_sweep_transition(self, seg_a: AudioSegment, seg_b: AudioSegment,
                                  start_freq: int = 20000, end_freq: int = 100,
@@ -117,11 +173,13 @@ class TransitionGenerator:
         """
         num_chunks = len(seg_a) // chunk_size_ms
         filtered_a = AudioSegment.empty()
-        freq_curve = np.linspace(start_freq, end_freq, num_chunks)
-        
+        # One cast for the whole curve; .item() hands pydub a plain int
+        # without a per-iteration Python conversion
+        freq_curve = np.linspace(start_freq, end_freq, num_chunks).astype(np.int32)
+
         for i in range(num_chunks):
             chunk = seg_a[i * chunk_size_ms:(i + 1) * chunk_size_ms]
-            filtered_chunk = chunk.low_pass_filter(int(freq_curve[i]))
+            filtered_chunk = chunk.low_pass_filter(freq_curve[i].item())
             filtered_a += filtered_chunk
         
         return filtered_a.overlay(seg_b.fade_in(len(seg_b)))
@@ -158,29 +216,67 @@ class TransitionGenerator:
     def hard_cut_transition(self, seg_a: AudioSegment, seg_b: AudioSegment) -> AudioSegment:
         """
         Perform a hard cut in the middle of the transition period.
-        
+
+        One bytes concatenation on the raw buffers replaces the two
+        pydub millisecond slices plus the append, each of which copies
+        and re-wraps its half as a new AudioSegment.
+
         Args:
             seg_a: First audio segment
             seg_b: Second audio segment
-            
+
         Returns:
             Audio segment with hard cut transition
         """
-        halfway_point = len(seg_a) // 2
-        return seg_a[:halfway_point] + seg_b[halfway_point:]
+        raw_a = seg_a.raw_data
+        raw_b = seg_b.raw_data
+        # Cut on a frame boundary so channels stay aligned
+        cut = min(len(raw_a), len(raw_b)) // 2
+        cut -= cut % seg_a.frame_width
+        return seg_a._spawn(raw_a[:cut] + raw_b[cut:])
     
     def linear_fade_transition(self, seg_a: AudioSegment, seg_b: AudioSegment) -> AudioSegment:
         """
         Create a simple linear crossfade transition.
-        
+
+        As the default transition this is the hottest pydub path, so it
+        mixes the raw int16 buffers against the cached linear ramp in
+        one multiply-add pass instead of chaining fade_out/fade_in and
+        a full-buffer overlay.
+
         Args:
             seg_a: First audio segment
             seg_b: Second audio segment
-            
+
         Returns:
             Mixed audio segment with linear fade transition
         """
-        return seg_a.fade_out(len(seg_a)).overlay(seg_b.fade_in(len(seg_b)))
+        a = np.frombuffer(seg_a.raw_data, dtype=np.int16)
+        b = np.frombuffer(seg_b.raw_data, dtype=np.int16)
+
+        channels = seg_a.channels
+        frames = min(len(a), len(b)) // channels
+        n = frames * channels
+
+        if crossfade_int16 is not None and channels == 1:
+            # Fused JIT kernel: ramp, gains, add and int16 cast in one
+            # parallel pass over the raw buffers, no float temporaries
+            out = np.empty(n, dtype=np.int16)
+            crossfade_int16(a[:n], b[:n], out)
+            return seg_a._spawn(out.tobytes())
+
+        a = a.astype(np.float32)
+        b = b.astype(np.float32)
+
+        ramp = _make_gain_curve(frames, 'in', 1.0)
+        if channels == 2:
+            ramp = np.repeat(ramp, 2)
+
+        mixed = a[:n] * (1.0 - ramp)
+        mixed += b[:n] * ramp
+
+        return seg_a._spawn(
+            np.clip(mixed, -32768, 32767).astype(np.int16).tobytes())
     
     def exponential_fade_transition(self, seg_a: AudioSegment, seg_b: AudioSegment,
                                   power_out_range: Tuple[float, float] = (1.5, 3.0),
@@ -205,20 +301,203 @@ class TransitionGenerator:
         
         return faded_a.overlay(faded_b)
     
+    def _low_pass_sweep_array(self, arr_a: np.ndarray, arr_b: np.ndarray,
+                              start_freq: int = 20000, end_freq: int = 100,
+                              chunk_size_ms: int = 50) -> np.ndarray:
+        """
+        Filter-sweep transition on int16 arrays via a time-varying IIR.
+
+        One SciPy sosfilt call per coefficient step runs the whole sweep
+        in C on the contiguous buffer, with filter state carried across
+        chunk boundaries to avoid clicks. Replaces the pydub path's
+        per-chunk segment slicing and quadratic AudioSegment appends.
+
+        Args:
+            arr_a: First int16 audio array
+            arr_b: Second int16 audio array
+            start_freq: Starting frequency for the sweep
+            end_freq: Ending frequency for the sweep
+            chunk_size_ms: Size of each coefficient step in milliseconds
+
+        Returns:
+            Mixed int16 audio array with the filter sweep transition
+        """
+        n = min(len(arr_a), len(arr_b))
+        a = np.asarray(arr_a[:n], dtype=np.float32)
+        b = np.asarray(arr_b[:n], dtype=np.float32)
+
+        chunk = max(1, int(self.target_sr * chunk_size_ms / 1000))
+        num_chunks = max(1, n // chunk)
+        nyquist = self.target_sr / 2
+        freq_curve = np.clip(np.linspace(start_freq, end_freq, num_chunks),
+                             1.0, nyquist * 0.99)
+
+        filtered_a = np.empty(n, dtype=np.float32)
+        zi = np.zeros((1, 2))  # one second-order section for order 2
+        for i in range(num_chunks):
+            lo = i * chunk
+            hi = n if i == num_chunks - 1 else lo + chunk
+            sos = _butter_sos(2, float(freq_curve[i]), self.target_sr, 'low')
+            filtered_a[lo:hi], zi = signal.sosfilt(sos, a[lo:hi], zi=zi)
+
+        mixed = filtered_a + b * _make_gain_curve(n, 'in', 1.0)
+        return np.clip(mixed, -32768, 32767).astype(np.int16)
+
+    def _bass_swap_array(self, arr_a: np.ndarray, arr_b: np.ndarray,
+                         crossover_freq: int = 250) -> np.ndarray:
+        """
+        Bass-swap transition on int16 arrays with one filter per source.
+
+        A single SOS low-pass per track yields the lows; the highs are
+        the exact complement (full - lows) of a linear filter, so the
+        four pydub filter passes collapse to two sosfilt calls and the
+        overlays become adds on one mix buffer.
+
+        Args:
+            arr_a: First int16 audio array
+            arr_b: Second int16 audio array
+            crossover_freq: Frequency crossover point in Hz
+
+        Returns:
+            Mixed int16 audio array with the bass swap transition
+        """
+        n = min(len(arr_a), len(arr_b))
+        a = np.asarray(arr_a[:n], dtype=np.float32)
+        b = np.asarray(arr_b[:n], dtype=np.float32)
+
+        sos = _butter_sos(4, crossover_freq, self.target_sr, 'low')
+        lows_a = signal.sosfilt(sos, a)
+        lows_b = signal.sosfilt(sos, b)
+        highs_a = a - lows_a
+        highs_b = b - lows_b
+
+        # Highs crossfade over the whole window; bass A carries the
+        # first half, bass B the second
+        halfway_point = n // 2
+        mixed = highs_a * _make_gain_curve(n, 'out', 1.0)
+        mixed += highs_b * _make_gain_curve(n, 'in', 1.0)
+        mixed[:halfway_point] += lows_a[:halfway_point]
+        mixed[halfway_point:] += lows_b[halfway_point:]
+
+        return np.clip(mixed, -32768, 32767).astype(np.int16)
+
+    def _echo_fade_array(self, arr_a: np.ndarray, arr_b: np.ndarray,
+                         beat_duration_ms: int = 500, num_echos: int = 4,
+                         decay_db: int = 6) -> np.ndarray:
+        """
+        Echo-fade transition on int16 arrays with one mix buffer.
+
+        The crossfade and every echo are slice-adds into a single
+        float32 buffer, instead of a full-buffer pydub overlay (decode,
+        sum, re-encode) per echo.
+
+        Args:
+            arr_a: First int16 audio array
+            arr_b: Second int16 audio array
+            beat_duration_ms: Duration of one beat in milliseconds
+            num_echos: Number of echo repetitions
+            decay_db: Volume decay per echo in dB
+
+        Returns:
+            Mixed int16 audio array with the echo fade transition
+        """
+        n = min(len(arr_a), len(arr_b))
+        a = np.asarray(arr_a[:n], dtype=np.float32)
+        b = np.asarray(arr_b[:n], dtype=np.float32)
+
+        mixed = a * _make_gain_curve(n, 'out', 1.0)
+        mixed += b * _make_gain_curve(n, 'in', 1.0)
+
+        beat_len = max(1, int(self.target_sr * beat_duration_ms / 1000))
+        last_beat = a[-beat_len:]
+        # Per-echo gains precomputed from the dB decay
+        gains = 10.0 ** (-np.arange(num_echos) * decay_db / 20.0)
+
+        for i in range(num_echos):
+            start = n - beat_len + i * beat_len
+            if start >= n:
+                break
+            end = min(start + beat_len, n)
+            mixed[start:end] += last_beat[:end - start] * np.float32(gains[i])
+
+        return np.clip(mixed, -32768, 32767).astype(np.int16)
+
+    def _create_transition_array(self, arr_a: np.ndarray, arr_b: np.ndarray,
+                                 transition_type: str, **kwargs) -> np.ndarray:
+        """
+        NumPy fast path for the fade and cut transitions.
+
+        Mixes int16 arrays directly, skipping the AudioSegment byte
+        copies that the pydub path pays per clip.
+
+        Args:
+            arr_a: First int16 audio array
+            arr_b: Second int16 audio array
+            transition_type: any of the named transition types; unknown
+                types default to a linear fade
+            **kwargs: Additional parameters for specific transition types
+
+        Returns:
+            Mixed int16 audio array with the specified transition
+        """
+        if transition_type == 'filter_sweep':
+            return self._low_pass_sweep_array(arr_a, arr_b, **kwargs)
+        if transition_type == 'echo_fade':
+            return self._echo_fade_array(arr_a, arr_b, **kwargs)
+        if transition_type == 'bass_swap_eq':
+            return self._bass_swap_array(arr_a, arr_b, **kwargs)
+
+        n = min(len(arr_a), len(arr_b))
+
+        if transition_type == 'hard_cut':
+            halfway_point = n // 2
+            return np.concatenate((arr_a[:halfway_point], arr_b[halfway_point:n]))
+
+        if transition_type == 'exp_fade':
+            t = np.linspace(0.0, 1.0, n, dtype=np.float32)
+            power_out = random.uniform(*kwargs.get('power_out_range', (1.5, 3.0)))
+            power_in = random.uniform(*kwargs.get('power_in_range', (0.3, 0.8)))
+            fade_out = 1.0 - t ** power_out
+            fade_in = t ** power_in
+        else:  # linear_fade and the default
+            if crossfade_int16 is not None:
+                out = np.empty(n, dtype=np.int16)
+                crossfade_int16(np.ascontiguousarray(arr_a[:n]),
+                                np.ascontiguousarray(arr_b[:n]), out)
+                return out
+            t = np.linspace(0.0, 1.0, n, dtype=np.float32)
+            fade_out = 1.0 - t
+            fade_in = t
+
+        # Exponential fade gains sum past 1.0 mid-fade, so clip before
+        # the cast like every other mix helper here
+        mixed = arr_a[:n] * fade_out
+        mixed += arr_b[:n] * fade_in
+        return np.clip(mixed, -32768, 32767).astype(np.int16)
+
     def create_transition(self, seg_a: AudioSegment, seg_b: AudioSegment,
                          transition_type: str, **kwargs) -> AudioSegment:
         """
         Create a transition using the specified technique.
-        
+
+        Int16 NumPy arrays are the preferred input: every transition
+        type then runs on float32 buffers without AudioSegment byte
+        round trips, and the result is an int16 array. AudioSegment
+        inputs still work and go through the pydub methods.
+
         Args:
-            seg_a: First audio segment
-            seg_b: Second audio segment
+            seg_a: First audio segment or int16 NumPy array
+            seg_b: Second audio segment (same type as seg_a)
             transition_type: Type of transition to create
             **kwargs: Additional parameters for specific transition types
-            
+
         Returns:
-            Mixed audio segment with the specified transition
+            Mixed audio (same container type as the inputs)
         """
+        if isinstance(seg_a, np.ndarray):
+            return self._create_transition_array(seg_a, seg_b,
+                                                 transition_type, **kwargs)
+
         if transition_type == 'linear_fade':
             return self.linear_fade_transition(seg_a, seg_b)
         elif transition_type == 'exp_fade':
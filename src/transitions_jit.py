@@ -0,0 +1,39 @@
+"""
+JIT-Compiled Transition Kernels
+
+Numba-compiled inner loops for the transition hot path. Numba is
+already pulled in transitively by librosa, so no extra dependency is
+introduced; callers should still fall back to the NumPy path when the
+import fails.
+"""
+
+import numpy as np
+from numba import njit, prange
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def crossfade_int16(a: np.ndarray, b: np.ndarray, out: np.ndarray) -> None:
+    """
+    Linear crossfade of two int16 buffers into a preallocated output.
+
+    Fuses the ramp generation, both gain multiplies, the add, and the
+    int16 cast into one parallel pass, so no float32 temporaries the
+    size of the clip are ever allocated.
+
+    Args:
+        a: First int16 audio array (fading out)
+        b: Second int16 audio array (fading in)
+        out: Preallocated int16 output; its length sets the mix length
+    """
+    n = out.shape[0]
+    inv = 1.0 / (n - 1) if n > 1 else 0.0
+    for i in prange(n):
+        t = i * inv
+        out[i] = np.int16(a[i] + (b[i] - a[i]) * t)
+
+
+def warm_cache() -> None:
+    """Trigger JIT compilation on a tiny input so real calls pay no warmup."""
+    crossfade_int16(np.zeros(4, dtype=np.int16),
+                    np.zeros(4, dtype=np.int16),
+                    np.zeros(4, dtype=np.int16))
@@ -6,46 +6,79 @@ Monitor Google Drive upload progress when using rclone.
 Run this in a separate terminal while upload is running.
 """
 
-import os
 import time
+import json
 import subprocess
-import re
+import requests
+from collections import deque
 from datetime import datetime, timedelta
 
+# rclone remote-control endpoint; the upload script starts rclone with
+# --rc so progress comes from a local HTTP call instead of forking
+# pgrep / rclone size (which walks the remote over HTTPS) every tick
+RC_URL = "http://localhost:5572"
+
+_rc_session = requests.Session()
+
+def rc_stats():
+    """Fetch rclone core/stats over the RC API; None when unreachable."""
+    try:
+        resp = _rc_session.post(f"{RC_URL}/core/stats", json={}, timeout=2)
+        if resp.ok:
+            return resp.json()
+    except requests.RequestException:
+        pass
+    return None
+
 def get_upload_progress():
     """Check rclone progress and Google Drive folder size."""
+    stats = rc_stats()
+    if stats is not None:
+        done_gb = stats.get('bytes', 0) / (1024 ** 3)
+        speed_mb = stats.get('speed', 0) / (1024 ** 2)
+        eta = stats.get('eta')
+        eta_text = f", ETA {eta / 60:.0f} min" if eta else ""
+        return (f"🚀 UPLOADING - {done_gb:.2f} GB sent, "
+                f"{speed_mb:.1f} MB/s{eta_text}"), True
+
     try:
-        # Check if rclone is running
+        # rclone running without --rc: fall back to a process probe
         result = subprocess.run(['pgrep', 'rclone'], capture_output=True, text=True)
         rclone_running = bool(result.stdout.strip())
-        
+
         if rclone_running:
             status = "🚀 UPLOADING"
         else:
             status = "⏸️  NOT RUNNING"
-        
+
         return status, rclone_running
-        
+
     except Exception as e:
         return f"❌ ERROR: {e}", False
 
 def check_gdrive_folder():
     """Check Google Drive folder size using rclone."""
+    # The RC stats already carry the in-flight transfers; showing them
+    # costs nothing and skips a Drive API folder walk per tick
+    stats = rc_stats()
+    if stats is not None:
+        transferring = stats.get('transferring') or []
+        if transferring:
+            names = ", ".join(t.get('name', '?') for t in transferring[:3])
+            return f"📁 Transferring: {names}"
+
     try:
-        result = subprocess.run(['rclone', 'size', 'gdrive:DJNet_Dataset/'], 
+        result = subprocess.run(['rclone', 'size', 'gdrive:DJNet_Dataset/', '--json'],
                               capture_output=True, text=True, timeout=30)
-        
+
         if result.returncode == 0:
-            # Parse output: "Total objects: X, Total size: Y"
-            output = result.stdout.strip()
-            size_match = re.search(r'Total size: ([\d.]+\s*\w+)', output)
-            count_match = re.search(r'Total objects: (\d+)', output)
-            
-            if size_match and count_match:
-                size = size_match.group(1)
-                count = count_match.group(1)
-                return f"📁 Google Drive: {count} files, {size}"
-            else:
+            # Structured output: {"count": N, "bytes": B} -- no regex
+            # over locale-dependent human-readable sizes
+            try:
+                data = json.loads(result.stdout)
+                return (f"📁 Google Drive: {data['count']} files, "
+                        f"{data['bytes'] / 1024**3:.2f} GiB")
+            except (ValueError, KeyError):
                 return "📁 Google Drive: Connected"
         else:
             return "📁 Google Drive: Not accessible"
@@ -55,24 +88,31 @@ def check_gdrive_folder():
     except Exception as e:
         return f"📁 Google Drive: Error - {e}"
 
-def estimate_completion(start_time, current_size_gb, target_size_gb):
-    """Estimate completion time based on progress."""
+# Sliding window of (monotonic_time, gb_uploaded) samples: the rate
+# reflects the last ~10 polls instead of the average since the monitor
+# started, so the ETA recovers quickly after a network stall
+_rate_samples = deque(maxlen=10)
+
+def estimate_completion(current_size_gb, target_size_gb):
+    """Estimate completion time from the recent upload rate."""
     if current_size_gb <= 0 or target_size_gb <= 0:
         return "Unknown"
-    
-    elapsed_time = time.time() - start_time
-    if elapsed_time <= 0:
+
+    _rate_samples.append((time.monotonic(), current_size_gb))
+    if len(_rate_samples) < 2:
         return "Calculating..."
-    
-    upload_rate = current_size_gb / elapsed_time  # GB/second
-    remaining_gb = target_size_gb - current_size_gb
-    
+
+    # monotonic() never goes backwards, so the time delta across the
+    # window is always positive; only a stalled transfer needs a guard
+    (t0, gb0), (t1, gb1) = _rate_samples[0], _rate_samples[-1]
+    upload_rate = (gb1 - gb0) / (t1 - t0)  # GB/second
     if upload_rate <= 0:
-        return "Unknown"
-    
+        return "Stalled"
+
+    remaining_gb = target_size_gb - current_size_gb
     eta_seconds = remaining_gb / upload_rate
     eta_time = datetime.now() + timedelta(seconds=eta_seconds)
-    
+
     return f"{eta_time.strftime('%H:%M')} ({eta_seconds/3600:.1f}h remaining)"
 
 def monitor_upload():
@@ -88,8 +128,9 @@ def monitor_upload():
     
     try:
         while True:
-            # Clear screen
-            os.system('clear' if os.name == 'posix' else 'cls')
+            # Clear screen with ANSI cursor-home + erase: no subprocess
+            # fork per refresh
+            print('\x1b[H\x1b[J', end='')
             
             print("📤 DJNet Google Drive Upload Monitor")
             print("=" * 50)